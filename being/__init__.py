@@ -1,27 +1,73 @@
-"""PATHOS being core."""
+"""PATHOS being core.
+
+The most common building blocks are also available directly from the package
+namespace (e.g. ``being.awake``). They are imported lazily on first access so
+that ``import being`` itself stays cheap.
+"""
+import importlib
 import sys
+from typing import TYPE_CHECKING
 
 
 # python-can PCAN on darwin patch. This is issue will get fixed with python-can
 # >= 4.0.0
-try:
-    import can
-    import canopen
-    from being.can.pcan_darwin_patch import (
-        is_pcan_lib_installed,
-        does_python_can_need_patching,
-        patch_pcan_on_darwin,
-    )
+if sys.platform.startswith('darwin'):
+    try:
+        from being.can.pcan_darwin_patch import (
+            is_pcan_lib_installed,
+            does_python_can_need_patching,
+            patch_pcan_on_darwin,
+        )
 
-    if (sys.platform.startswith('darwin')
-        and is_pcan_lib_installed()
-        and does_python_can_need_patching()
-    ):
-        patch_pcan_on_darwin()
-except ImportError:
-    pass
+        if is_pcan_lib_installed() and does_python_can_need_patching():
+            patch_pcan_on_darwin()
+    except ImportError:
+        pass
 
 
 
 __author__ = 'atheler'
 __version__ = '1.0.2'
+
+
+_LAZY_ATTRIBUTES = {
+    'awake': 'being.awakening',
+    'CanBackend': 'being.backends',
+    'Behavior': 'being.behavior',
+    'Sine': 'being.blocks',
+    'Trafo': 'being.blocks',
+    'MotionPlayer': 'being.motion_player',
+    'DummyMotor': 'being.motors',
+    'LinearMotor': 'being.motors',
+    'RotaryMotor': 'being.motors',
+    'manage_resources': 'being.resources',
+    'register_resource': 'being.resources',
+}
+"""Public attribute name -> defining module."""
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    try:
+        modname = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+    obj = getattr(importlib.import_module(modname), name)
+    globals()[name] = obj  # Cache. Next lookup will not reach __getattr__
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+if TYPE_CHECKING:
+    from being.awakening import awake
+    from being.backends import CanBackend
+    from being.behavior import Behavior
+    from being.blocks import Sine, Trafo
+    from being.motion_player import MotionPlayer
+    from being.motors import DummyMotor, LinearMotor, RotaryMotor
+    from being.resources import manage_resources, register_resource
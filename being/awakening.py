@@ -10,11 +10,16 @@ Example:
 The interval rate can be configured inside :mod:`being.configuration`.
 """
 import asyncio
+import ctypes
+import ctypes.util
+import errno
+import importlib
 import os
 import signal
 import sys
 import time
-from typing import Optional, Iterable
+import warnings
+from typing import Optional, Iterable, TYPE_CHECKING
 
 from being.backends import CanBackend
 from being.being import Being
@@ -25,8 +30,9 @@ from being.connectables import MessageInput
 from being.logging import get_logger
 from being.pacemaker import Pacemaker
 from being.resources import register_resource
-from being.web.server import init_web_server, run_web_server
-from being.web.web_socket import WebSocket
+
+if TYPE_CHECKING:
+    from being.web.web_socket import WebSocket
 
 
 # Look before you leap
@@ -38,6 +44,65 @@ _WEB_INTERVAL = CONFIG['Web']['INTERVAL']
 LOGGER = get_logger(name=__name__, parent=None)
 
 
+class _Timespec(ctypes.Structure):
+
+    """C struct timespec."""
+
+    _fields_ = [('tv_sec', ctypes.c_long), ('tv_nsec', ctypes.c_long)]
+
+
+_TIMER_ABSTIME = 1
+
+
+def _load_clock_nanosleep():
+    """Load clock_nanosleep() from libc. None if not available (non Linux)."""
+    if not sys.platform.startswith('linux'):
+        return None
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6')
+        func = libc.clock_nanosleep
+    except (OSError, AttributeError):
+        return None
+
+    func.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.POINTER(_Timespec), ctypes.c_void_p]
+    func.restype = ctypes.c_int
+    return func
+
+
+_clock_nanosleep = _load_clock_nanosleep()
+
+
+def _monotonic() -> float:
+    """Monotonic clock time matching :func:`_sleep_until` deadlines."""
+    if _clock_nanosleep is None:
+        return time.perf_counter()
+
+    return time.clock_gettime(time.CLOCK_MONOTONIC)
+
+
+def _sleep_until(deadline: float):
+    """Sleep until absolute :func:`_monotonic` deadline. Uses
+    clock_nanosleep() with TIMER_ABSTIME where available so that the wake up
+    time does not depend on when the sleep call was issued. Falls back to
+    relative :func:`time.sleep`.
+
+    Args:
+        deadline: Absolute wake up time.
+    """
+    if _clock_nanosleep is None:
+        sleepTime = deadline - time.perf_counter()
+        if sleepTime > 0:
+            time.sleep(sleepTime)
+
+        return
+
+    sec, frac = divmod(deadline, 1.)
+    ts = _Timespec(int(sec), int(frac * 1e9))
+    while _clock_nanosleep(time.CLOCK_MONOTONIC, _TIMER_ABSTIME, ctypes.byref(ts), None) == errno.EINTR:
+        pass  # Interrupted by signal. Deadline is absolute, sleep again
+
+
 def _exit_signal_handler(signum=None, frame=None):
     """Signal handler for exit program."""
     #pylint: disable=unused-argument
@@ -53,14 +118,9 @@ def _run_being_standalone(being: Being):
     if os.name == 'posix':
         signal.signal(signal.SIGTERM, _exit_signal_handler)
 
-    cycle = int(time.perf_counter() / _INTERVAL)
+    cycle = int(_monotonic() / _INTERVAL)
     while True:
-        now = time.perf_counter()
-        then = cycle * _INTERVAL
-        sleepTime = then - now
-        if sleepTime >= 0:
-            time.sleep(then - now)
-
+        _sleep_until(cycle * _INTERVAL)
         being.single_cycle()
         cycle += 1
 
@@ -84,7 +144,7 @@ async def _run_being_async(being: Being):
         cycle += 1
 
 
-async def _send_being_state_to_front_end(being: Being, ws: WebSocket):
+async def _send_being_state_to_front_end(being: Being, ws: 'WebSocket'):
     """Keep capturing the current being state and send it to the front-end.
     Taken out from ex being._run_web() because web socket send might block being
     main loop.
@@ -126,6 +186,11 @@ async def _run_being_with_web_server(being: Being):
     Args:
         being: Being application instance.
     """
+    # Web dependencies are optional (being[web]). Only import them when
+    # actually running with the web server.
+    from being.web.server import init_web_server, run_web_server
+    from being.web.web_socket import WebSocket
+
     ws = WebSocket()
     app = init_web_server(being, ws)
     await asyncio.gather(
@@ -160,13 +225,21 @@ def awake(
     Args:
         blocks: Some blocks of the network. Remaining blocks will be auto
             discovered.
-        web: Run with web server.
+        web: Run with web server. Falls back to running headless (with a
+            warning) if the web dependencies are not installed.
         enableMotors: Enable motors on startup.
         homeMotors: Home motors on startup.
         usePacemaker: If to use an extra pacemaker thread.
         clock: Clock instance.
         network: CanBackend instance.
     """
+    if web:
+        try:
+            importlib.import_module('being.web')
+        except ImportError as err:
+            warnings.warn(f'{err}. Running without web server.')
+            web = False
+
     if clock is None:
         clock = Clock.single_instance_setdefault()
 
@@ -34,6 +34,7 @@ from being.can.nmt import PRE_OPERATIONAL, OPERATIONAL, RESET_COMMUNICATION
 from being.configuration import CONFIG
 from being.logging import get_logger
 from being.math import linear_mapping
+from being.resources import register_resource
 from being.rpi_gpio import GPIO
 from being.utils import SingleInstanceCache, filter_by_type
 
@@ -174,6 +175,18 @@ class CanBackend(canopen.Network, SingleInstanceCache, contextlib.AbstractContex
             self.disconnect()
 
 
+def default_can_backend() -> CanBackend:
+    """Get the shared CAN backend. Created and registered in the global being
+    exit stack on first call, reused afterwards.
+
+    Returns:
+        CanBackend instance.
+    """
+    network = CanBackend.single_instance_setdefault()
+    register_resource(network, duplicates=False)
+    return network
+
+
 def pyaudio_format(dtype: Union[str, np.dtype, type]) -> int:
     """Determine pyaudio format number for data type.
 
@@ -10,7 +10,7 @@ from being.can.nmt import OPERATIONAL, PRE_OPERATIONAL
 from being.clock import Clock
 from being.configuration import CONFIG
 from being.connectables import ValueOutput, MessageOutput
-from being.execution import execute, block_network_graph
+from being.execution import compile_execution_order, block_network_graph
 from being.graph import Graph, topological_sort
 from being.logging import get_logger
 from being.motion_player import MotionPlayer
@@ -85,6 +85,8 @@ class Being:
         self.execOrder: List[Block] = topological_sort(self.graph)
         """Block execution order."""
 
+        self._execute = compile_execution_order(self.execOrder)
+
         self.logger = get_logger(type(self).__name__)
 
         self.valueOutputs: List[ValueOutput] = list(value_outputs(self.execOrder))
@@ -142,7 +144,7 @@ class Being:
 
         self.pacemaker.tick()
 
-        execute(self.execOrder)
+        self._execute()
 
         if self.network:
             self.network.transmit_all_rpdos()
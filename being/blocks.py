@@ -31,11 +31,29 @@ class Sine(Block):
         self.add_value_input('frequency')
         self.add_value_output()
         self.frequency.value = frequency
+        self._frequency = None
+        self._phaseIncrement = 0.
 
     def update(self):
-        self.output.value = math.sin(self.phase)
-        self.phase += TAU * self.frequency.value * INTERVAL
-        self.phase %= TAU
+        frequency = self.frequency.value
+        if frequency != self._frequency:
+            # Only recompute phase increment when frequency changes
+            self._frequency = frequency
+            self._phaseIncrement = TAU * frequency * INTERVAL
+
+        phase = self.phase
+        self.output.value = math.sin(phase)
+        phase += self._phaseIncrement
+        if phase >= TAU:
+            # Phase crosses TAU at most once per period for 0 < frequency <
+            # 1 / INTERVAL. Cheaper than float modulo
+            phase -= TAU
+
+        if not 0. <= phase < TAU:
+            # Negative or excessive frequencies
+            phase %= TAU
+
+        self.phase = phase
 
     def __str__(self):
         return '%s()' % type(self).__name__
@@ -111,23 +129,39 @@ class Printer(Block):
 
     """Print input values to stdout."""
 
-    def __init__(self, prefix: str = '', carriageReturn: bool = False, **kwargs):
+    def __init__(self,
+            prefix: str = '',
+            carriageReturn: bool = False,
+            period: float = 0.,
+            **kwargs,
+        ):
         """
         Args:
             prefix (optional): Prefix string to prepend.
             carriageReturn (optional). Prepend carriage return character to each output.
+            period (optional): Minimum duration between two outputs in seconds.
+                Default is to print every cycle.
         """
         super().__init__(**kwargs)
         self.prefix = prefix
         self.carriageReturn = carriageReturn
         self.add_value_input()
+        self.everyNth = max(1, round(period / INTERVAL))
+        self._counter = 0
+        # Same output as print('\r\033c', prefix, value, end='') / print(prefix, value)
+        self._head = ('\r\033c ' if carriageReturn else '') + prefix + ' '
+        self._tail = '' if carriageReturn else '\n'
 
     def update(self):
+        self._counter -= 1
+        if self._counter > 0:
+            return
+
+        self._counter = self.everyNth
+        stdout = sys.stdout
+        stdout.write(self._head + str(self.input.value) + self._tail)
         if self.carriageReturn:
-            print('\r\033c', self.prefix, self.input.value, end='')
-            sys.stdout.flush()
-        else:
-            print(self.prefix, self.input.value)
+            stdout.flush()
 
 
 def sine_pulse(phase: float) -> float:
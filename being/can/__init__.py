@@ -21,6 +21,7 @@ See Also:
 """
 import pkgutil
 import contextlib
+import functools
 import io
 import os
 from typing import Dict, Optional, Iterator
@@ -81,6 +82,20 @@ def sdo_client(network: Network, nodeId: int, od: Optional[ObjectDictionary] = N
         network.unsubscribe(txCob)
 
 
+@functools.lru_cache(maxsize=None)
+def _read_eds(fileName: str) -> str:
+    """Read packaged EDS file. Cached since multiple nodes of the same kind
+    share the same EDS file.
+
+    Args:
+        fileName: EDS filepath relative to this package.
+
+    Returns:
+        EDS file content.
+    """
+    return pkgutil.get_data(__name__, fileName).decode()
+
+
 def _load_local_eds(deviceType: bytes, productCode=None) -> io.StringIO:
     """Given deviceType try to load local EDS file.
 
@@ -93,8 +108,7 @@ def _load_local_eds(deviceType: bytes, productCode=None) -> io.StringIO:
     fp = SUPPORTED_DEVICE_TYPES[deviceType]
     if productCode:
         fp = fp[productCode]
-    data = pkgutil.get_data(__name__, fp)
-    return io.StringIO(data.decode())
+    return io.StringIO(_read_eds(fp))
 
 
 def load_object_dictionary(network: Network, nodeId: int) -> ObjectDictionary:
@@ -134,5 +148,4 @@ def load_object_dictionary(network: Network, nodeId: int) -> ObjectDictionary:
 
 
 def load_object_dictionary_from_eds(fileName, nodeId):
-    data = pkgutil.get_data(__name__, fileName)
-    return import_eds(io.StringIO(data.decode()), nodeId)
+    return import_eds(io.StringIO(_read_eds(fileName)), nodeId)
@@ -4,6 +4,7 @@ from typing import (
     Dict,
     Iterator,
     List,
+    Optional,
     Set,
     Tuple,
     Union,
@@ -118,6 +119,11 @@ class State(enum.Enum):
     FAULT = enum.auto()
     HALT = enum.auto()
 
+    # Enum.__hash__ is a Python level hash(self._name_). Members are singletons
+    # compared by identity so the builtin identity hash is equivalent and
+    # makes the (State, State) transition lookups a lot cheaper.
+    __hash__ = object.__hash__
+
 
 StateSwitching = Iterator[State]
 Edge = Tuple[State, State]
@@ -292,6 +298,32 @@ STATUSWORD_2_STATE: List[Tuple[int, int, State]] = [
 :meta hide-value:
 """
 
+STATE_BITS_MASK: int = 0
+"""Union of all statusword bits which are relevant for the state."""
+
+for _mask, _, _ in STATUSWORD_2_STATE:
+    STATE_BITS_MASK |= _mask
+
+
+def _lookup_state(statusword: int) -> Optional[State]:
+    """First matching state in STATUSWORD_2_STATE (if any)."""
+    for mask, value, state in STATUSWORD_2_STATE:
+        if (statusword & mask) == value:
+            return state
+
+    return None
+
+
+STATUSWORD_LUT: List[Optional[State]] = [
+    _lookup_state(sw) for sw in range(STATE_BITS_MASK + 1)
+]
+"""Precomputed state lookup table indexed by the masked statusword (only the
+state bits). None for invalid bit combinations.
+
+:meta hide-value:
+"""
+
+
 def which_state(statusword: int) -> State:
     """Extract state from statusword number.
 
@@ -304,11 +336,11 @@ def which_state(statusword: int) -> State:
     Raises:
         ValueError: If no valid state was found.
     """
-    for mask, value, state in STATUSWORD_2_STATE:
-        if (statusword & mask) == value:
-            return state
+    state = STATUSWORD_LUT[statusword & STATE_BITS_MASK]
+    if state is None:
+        raise ValueError(f'Unknown state for statusword {statusword}!')
 
-    raise ValueError('Unknown state for statusword {statusword}!')
+    return state
 
 
 def supported_operation_modes(supportedDriveModes: int) -> Iterator[OperationMode]:
@@ -478,6 +510,41 @@ assert determine_homing_method(hardStop=True, direction=FORWARD) == -3
 assert determine_homing_method(hardStop=True, direction=BACKWARD) == -4
 
 
+def _search_shortest_state_path(start: State, end: State) -> List[State]:
+    """Breadth-first search for the shortest path from `start` to `end` state.
+    See :func:`find_shortest_state_path`.
+    """
+    if start == end:
+        return []
+
+    queue = collections.deque([[start]])
+    paths = []
+    while queue:
+        path = queue.popleft()
+        tail = path[-1]
+        for suc in POSSIBLE_TRANSITIONS[tail]:
+            if suc in path:
+                continue  # Cycle detected
+
+            if suc == end:
+                paths.append(path + [end])
+            else:
+                queue.append(path + [suc])
+
+    return min(paths, key=len, default=[])
+
+
+SHORTEST_STATE_PATHS: Dict[Edge, Tuple[State, ...]] = {
+    (_src, _dst): tuple(_search_shortest_state_path(_src, _dst))
+    for _src in State
+    for _dst in State
+}
+"""Precomputed shortest paths between all states. The state machine is static.
+
+:meta hide-value:
+"""
+
+
 def find_shortest_state_path(start: State, end: State) -> List[State]:
     """Find shortest path from `start` to `end` state. Start node is also
     included in returned path.
@@ -502,25 +569,7 @@ def find_shortest_state_path(start: State, end: State) -> List[State]:
         >>> find_shortest_state_path(State.OPERATION_ENABLED, State.NOT_READY_TO_SWITCH_ON)
         []  # Not possible to get to NOT_READY_TO_SWITCH_ON!
     """
-    if start == end:
-        return []
-
-    # Breadth-first search
-    queue = collections.deque([[start]])
-    paths = []
-    while queue:
-        path = queue.popleft()
-        tail = path[-1]
-        for suc in POSSIBLE_TRANSITIONS[tail]:
-            if suc in path:
-                continue  # Cycle detected
-
-            if suc == end:
-                paths.append(path + [end])
-            else:
-                queue.append(path + [suc])
-
-    return min(paths, key=len, default=[])
+    return list(SHORTEST_STATE_PATHS[start, end])
 
 
 def target_reached(statusword: int) -> bool:
@@ -567,8 +616,6 @@ def maybe_int(string: str) -> Union[int, str]:
 WHERE_TO_GO_NEXT: Dict[Edge, State] = {}
 """Lookup for the next intermediate state for a given state transition."""
 
-for _src in State:
-    for _dst in State:
-        _shortest = find_shortest_state_path(_src, _dst)
-        if _shortest:
-            WHERE_TO_GO_NEXT[(_src, _dst)] = _shortest[1]
+for _edge, _shortest in SHORTEST_STATE_PATHS.items():
+    if _shortest:
+        WHERE_TO_GO_NEXT[_edge] = _shortest[1]
@@ -16,14 +16,28 @@ Example:
     {'this': {'is': {'it': 1234}}}
 """
 import collections
+import functools
 import io
 import json
 import os
 from typing import Tuple, Any, Optional, TextIO, Dict
 
-import ruamel.yaml
-import tomlkit
-import configobj
+# Note: The round trip config libraries (ruamel.yaml, tomlkit, configobj) take
+# tens of milliseconds to import and most being programs only ever touch one
+# of them. They get imported inside the config implementations that use them.
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import tomllib  # Python >= 3.11
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
 
 from being.utils import NestedDict
 
@@ -55,6 +69,24 @@ def split_name(name: str) -> Tuple[str, str]:
     return name.rsplit('/', maxsplit=1)
 
 
+@functools.lru_cache(maxsize=1024)
+def name_to_keys(name: str) -> Tuple[str, ...]:
+    """Split config path name into key tuple. Cached since the same names get
+    accessed over and over again.
+
+    Args:
+        name: Config path name.
+
+    Returns:
+        Keys tuple.
+
+    Example:
+        >>> name_to_keys('this/is/it')
+        ('this', 'is', 'it')
+    """
+    return tuple(name.split(SEP))
+
+
 def guess_config_format(filepath: str) -> str:
     """Guess config format from file extension.
 
@@ -72,6 +104,28 @@ def guess_config_format(filepath: str) -> str:
     return ext[1:].lower()
 
 
+def _read_yaml(stream: TextIO) -> Any:
+    """Parse YAML without round trip information. ruamel's safe loader keeps
+    the YAML 1.2 semantics of the round trip loader but uses the C parser if
+    available (`ruamel.yaml.clib`).
+    """
+    import ruamel.yaml
+    return ruamel.yaml.YAML(typ='safe').load(stream)
+
+
+def _json_loads(string: str) -> Any:
+    """Parse JSON string. With orjson if available. Falls back to the standard
+    library for documents orjson rejects (e.g. NaN / Infinity literals).
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(string)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(string)
+
+
 class _ConfigImpl(NestedDict):
 
     """Base class for config implementation / interface.
@@ -109,7 +163,7 @@ class _ConfigImpl(NestedDict):
         if name == ROOT_NAME:
             return self.data
 
-        keys = tuple(name.split(SEP))
+        keys = name_to_keys(name)
         return self[keys]
 
     def store(self, name: str, value: Any):
@@ -118,7 +172,7 @@ class _ConfigImpl(NestedDict):
         Args:
             name: Config path name to store value under.
         """
-        keys = tuple(name.split(SEP))
+        keys = name_to_keys(name)
         self[keys] = value
 
     def erase(self, name: str):
@@ -127,7 +181,7 @@ class _ConfigImpl(NestedDict):
         Args:
             name: Config path name to erase.
         """
-        keys = tuple(name.split(SEP))
+        keys = name_to_keys(name)
         del self[keys]
 
     def storedefault(self, name: str, default: Any = None) -> Any:
@@ -141,7 +195,7 @@ class _ConfigImpl(NestedDict):
         Returns:
             Config value.
         """
-        keys = tuple(name.split(SEP))
+        keys = name_to_keys(name)
         return self.setdefault(keys, default)
 
     def loads(self, string: str):
@@ -178,21 +232,26 @@ class _TomlConfig(_ConfigImpl):
     """Config implementation for TOML format."""
 
     def __init__(self, data=None):
+        import tomlkit
         if data is None:
             data = tomlkit.document()  # Differs from default_factory=tomlkit.table
 
         super().__init__(data, default_factory=tomlkit.table)
 
     def loads(self, string):
+        import tomlkit
         self.data = tomlkit.loads(string)
 
     def load(self, stream):
+        import tomlkit
         self.data = tomlkit.loads(stream.read())
 
     def dumps(self):
+        import tomlkit
         return tomlkit.dumps(self.data)
 
     def dump(self, stream):
+        import tomlkit
         stream.write(tomlkit.dumps(self.data))
 
 
@@ -201,10 +260,12 @@ class _YamlConfig(_ConfigImpl):
     """Config implementation for YAML format."""
 
     def __init__(self, data=None):
+        import ruamel.yaml
         super().__init__(data,  default_factory=ruamel.yaml.CommentedMap)
         self.yaml = ruamel.yaml.YAML()
 
     def loads(self, string):
+        import ruamel.yaml
         data = self.yaml.load(string)
         if data is None:
             data = ruamel.yaml.CommentedMap()
@@ -212,6 +273,7 @@ class _YamlConfig(_ConfigImpl):
         self.data = data
 
     def load(self, stream):
+        import ruamel.yaml
         data = self.yaml.load(stream)
         if data is None:
             data = ruamel.yaml.CommentedMap()
@@ -238,10 +300,10 @@ class _JsonConfig(_ConfigImpl):
         super().__init__(data, default_factory=dict)
 
     def loads(self, string):
-        self.data = json.loads(string)
+        self.data = _json_loads(string)
 
     def load(self, stream):
-        self.data = json.load(stream)
+        self.data = _json_loads(stream.read())
 
     def dumps(self):
         return json.dumps(self.data, indent=4)
@@ -258,23 +320,29 @@ class _IniConfig(_ConfigImpl):
     """
 
     def __init__(self, data=None):
+        import configobj
         super().__init__(data, default_factory=configobj.ConfigObj)
 
     def loads(self, string):
+        import configobj
         buf = io.StringIO(string)
         self.data = configobj.ConfigObj(buf)
 
     def load(self, stream):
+        import configobj
         self.data = configobj.ConfigObj(stream)
 
     def dumps(self):
         buf = io.BytesIO()
         self.data.write(buf)
-        buf.seek(0)
-        return buf.read().decode()
+        return buf.getvalue().decode()
 
     def dump(self, stream):
-        return self.data.write(stream)
+        # ConfigObj always writes encoded bytes
+        if isinstance(stream, io.TextIOBase):
+            stream.write(self.dumps())
+        else:
+            self.data.write(stream)
 
 
 IMPLEMENTATIONS = {
@@ -376,3 +444,31 @@ class ConfigFile(Config):
 
     def __str__(self):
         return f'{type(self).__name__}({self.filepath!r})'
+
+
+def read_config(filepath: str) -> Dict:
+    """Read config file as plain Python data. Read-only counterpart of
+    :class:`ConfigFile` without round trip preservation (comments,
+    formatting). This allows for faster parsers where available.
+
+    Args:
+        filepath: Config file to read.
+
+    Returns:
+        Config data.
+    """
+    configFormat = guess_config_format(filepath)
+    if configFormat == 'yaml':
+        with open(filepath) as fp:
+            data = _read_yaml(fp)
+
+        if data is None:
+            return {}
+
+        return data
+
+    if configFormat == 'toml' and tomllib is not None:
+        with open(filepath, 'rb') as fp:
+            return tomllib.load(fp)
+
+    return ConfigFile(filepath).data
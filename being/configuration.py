@@ -16,7 +16,7 @@ import logging
 import os
 from typing import Dict, Any
 
-from being.configs import ConfigFile
+from being.configs import read_config
 from being.utils import update_dict_recursively
 
 
@@ -49,4 +49,4 @@ for fp in [
     os.path.join(os.getcwd(), 'being.yaml'),
 ]:
     if os.path.exists(fp):
-        update_dict_recursively(CONFIG, ConfigFile(fp))
+        update_dict_recursively(CONFIG, read_config(fp))
@@ -13,7 +13,7 @@ Note:
 """
 import collections
 import itertools
-from typing import Tuple, ForwardRef, Optional, Union, Set, Any, Iterable, Generator
+from typing import Tuple, ForwardRef, Optional, Union, Set, Any, Iterable, Iterator
 
 
 from being.error import BeingError
@@ -164,6 +164,8 @@ class OutputBase:
 
     """Base class for all outputs."""
 
+    __slots__ = ('owner', 'outgoingConnections')
+
     def __init__(self, owner: Optional[Block] = None):
         """
         Args:
@@ -200,6 +202,8 @@ class InputBase:
         incomingConnection (OutputBase): Connected OutputBase.
     """
 
+    __slots__ = ('owner', 'incomingConnection')
+
     def __init__(self, owner: Optional[Block] = None):
         """
         Args:
@@ -240,6 +244,10 @@ class _ValueContainer:
         `could` be a little bit faster.
     """
 
+    # Slot for _value is declared by the concrete classes. Two bases with
+    # non-empty __slots__ would give an instance layout conflict.
+    __slots__ = ()
+
     def __init__(self, value: Any = 0.):
         """
         Args:
@@ -273,6 +281,8 @@ class ValueInput(InputBase, _ValueContainer):
     _value attribute as a fallback when not connected.
     """
 
+    __slots__ = ('_value',)
+
     def __init__(self, owner: Optional[Block] = None, value: Any = 0.):
         super().__init__(owner)
         _ValueContainer.__init__(self, value)
@@ -302,6 +312,8 @@ class ValueOutput(OutputBase, _ValueContainer):
 
     """Value output. Will propagate its value to connected inputs."""
 
+    __slots__ = ('_value',)
+
     def __init__(self, owner: Optional[Block] = None, value=0.):
         super().__init__(owner)
         _ValueContainer.__init__(self, value)
@@ -314,6 +326,8 @@ class _MessageQueue:
     MAX_MESSAGES: int = 50
     """Maximum size of message queue."""
 
+    __slots__ = ()
+
     def __init__(self):
         self.queue = collections.deque(maxlen=self.MAX_MESSAGES)
 
@@ -321,10 +335,17 @@ class _MessageQueue:
         """Push message on the message queue."""
         self.queue.append(message)
 
-    def receive(self) -> Generator[Any, None, None]:
-        """Iterate over received messages."""
-        while self.queue:
-            yield self.queue.popleft()
+    def receive(self) -> Iterator[Any]:
+        """Iterate over received messages. Takes all messages out of the queue
+        at once. Messages arriving while iterating are kept for the next call.
+        """
+        queue = self.queue
+        if not queue:
+            return iter(())
+
+        messages = list(queue)
+        queue.clear()
+        return iter(messages)
 
     def receive_latest(self) -> Optional[Any]:
         """Return latest received messages (if any). Discard the rest."""
@@ -342,6 +363,10 @@ class MessageInput(InputBase, _MessageQueue):
     connected :class:`MessageOutput`.
     """
 
+    # __dict__ so that push() can be patched on single instances (see
+    # being.web.server.patch_sensor_to_web_socket())
+    __slots__ = ('queue', '__dict__')
+
     def __init__(self, owner: Optional[Block] = None):
         super().__init__(owner)
         _MessageQueue.__init__(self)
@@ -351,6 +376,8 @@ class MessageOutput(OutputBase):
 
     """Message output. Sends messages to all connected message inputs."""
 
+    __slots__ = ()
+
     def send(self, message: Any):
         """Send message to all connected message inputs."""
         for con in self.outgoingConnections:
@@ -42,7 +42,7 @@ def find_back_edges(graph) -> Generator[Edge, None, None]:
             continue
 
         visited.add(src)
-        for dst in reversed(graph.successors[src]):
+        for dst in reversed(graph.successors.get(src, ())):
             if dst in path:
                 yield src, dst
             else:
@@ -80,21 +80,25 @@ def topological_sort(graph: Graph) -> List[Vertex]:
         Topological sorting.
     """
     order = []
+    placed = set()  # Same as order but for fast membership tests
     dag = remove_back_edges(graph)
+    noVertices = ()
 
     def vertex_is_ready(vertex: Vertex) -> bool:
         """Check if vertex is ready for insertion into topological order."""
-        return all(p in order for p in dag.predecessors[vertex])
+        return placed.issuperset(dag.predecessors.get(vertex, noVertices))
 
     queue = collections.deque(dag.vertices)
     while queue:
         vertex = queue.popleft()
-        if vertex in order:
+        if vertex in placed:
             continue
 
-        successors = reversed(dag.successors[vertex])
+        # get() instead of [] so that the defaultdicts do not grow
+        successors = reversed(dag.successors.get(vertex, noVertices))
         if vertex_is_ready(vertex):
             order.append(vertex)
+            placed.add(vertex)
             queue.extendleft(successors)
         else:
             queue.extend(successors)
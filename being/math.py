@@ -6,7 +6,6 @@ from being.constants import TAU
 
 import numpy as np
 from numpy import ndarray
-import scipy.optimize
 
 
 def clip(number: float, lower: float, upper: float) -> float:
@@ -150,6 +149,9 @@ class ArchimedeanSpiral(NamedTuple):
                 cls.arc_length_helper(phi, b) + a * phi - arcLength,
             ]
 
+        # Deferred import. scipy.optimize is heavy and only needed here
+        import scipy.optimize
+
         x0 = [0.0, phi0]
         bEst, phiEst = scipy.optimize.fsolve(func, x0)
         return cls(a, b=bEst), phiEst
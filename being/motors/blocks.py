@@ -39,7 +39,7 @@ from typing import Optional, Dict, Any, Union
 
 import numpy as np
 
-from being.backends import CanBackend
+from being.backends import CanBackend, default_can_backend
 from being.block import Block
 from being.can import load_object_dictionary
 from being.can.cia_402 import CiA402Node, OperationMode
@@ -52,7 +52,6 @@ from being.motors.controllers import Controller, Mclm3002, Epos4, PathosStepper
 from being.motors.definitions import MotorState, MotorEvent, MotorInterface
 from being.motors.homing import DummyHoming, HomingState
 from being.motors.motors import get_motor, Motor
-from being.resources import register_resource
 
 
 __all__ = [
@@ -306,8 +305,7 @@ class CanMotor(MotorBlock):
         self.add_message_input('positionProfile')
 
         if network is None:
-            network = CanBackend.single_instance_setdefault()
-            register_resource(network, duplicates=False)
+            network = default_can_backend()
 
         if node is None:
             if objectDictionary is None:
@@ -397,9 +397,14 @@ class FlyByDecoder:
         Yields:
             Completely decoded objects.
         """
-        self.incomplete += new
-        while self.term in self.incomplete:
-            complete, self.incomplete = self.incomplete.split(self.term, maxsplit=1)
+        if self.term not in new:
+            # Only the new snippet has to be scanned. The incomplete rest
+            # never contains a termination character.
+            self.incomplete += new
+            return
+
+        *completes, self.incomplete = (self.incomplete + new).split(self.term)
+        for complete in completes:
             yield loads(complete)
 
 
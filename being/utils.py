@@ -5,6 +5,7 @@ import glob
 import itertools
 import os
 import random
+import threading
 import weakref
 from typing import Any, Iterable, Dict, List, Generator, Callable, Optional
 
@@ -176,6 +177,11 @@ class SingleInstanceCache:
     INSTANCES: Dict[type, weakref.ref] = {}
     """Instances cache."""
 
+    _INSTANCES_LOCK = threading.RLock()
+    """Guards instance creation. Reentrant since constructors might ask for
+    other single instances.
+    """
+
     @classmethod
     def single_instance_initialized(cls) -> bool:
         """Check if cached instance of cls exists."""
@@ -208,11 +214,17 @@ class SingleInstanceCache:
             :class:`cls` instance.
         """
         self = cls.single_instance_get()
-        if self is None:
-            self = cls(*args, **kwargs)
-            cls.INSTANCES[cls] = weakref.ref(self)
+        if self is not None:
+            return self
 
-        return self
+        with cls._INSTANCES_LOCK:
+            # Double-checked. Another thread might have been faster
+            self = cls.single_instance_get()
+            if self is None:
+                self = cls(*args, **kwargs)
+                cls.INSTANCES[cls] = weakref.ref(self)
+
+            return self
 
 
 class IdAware:
@@ -270,20 +282,27 @@ class NestedDict(collections.abc.MutableMapping):
 
         return (key,)
 
+    def _descend(self, d, key):
+        """Step into intermediate dictionary. Only create a new one (with
+        default_factory) if missing.
+        """
+        if key in d:
+            return d[key]
+
+        return d.setdefault(key, self.default_factory())
+
     def __setitem__(self, key, value):
         d = self.data
         *path, last = self._as_keys(key)
         for k in path:
-            #d = d[k]
-            d = d.setdefault(k, self.default_factory())
+            d = self._descend(d, k)
 
         d[last] = value
 
     def __getitem__(self, key):
         d = self.data
         for k in self._as_keys(key):
-            #d = d[k]
-            d = d.setdefault(k, self.default_factory())
+            d = self._descend(d, k)
 
         return d
 
@@ -318,7 +337,7 @@ class NestedDict(collections.abc.MutableMapping):
         d = self.data
         *path, last = self._as_keys(key)
         for k in path:
-            d = d.setdefault(k, self.default_factory())
+            d = self._descend(d, k)
 
         return d.setdefault(last, default)
 
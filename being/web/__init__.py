@@ -7,3 +7,12 @@ static folder.
 
 Data serialization can be found in :mod:`being.serialization`.
 """
+try:
+    import aiohttp
+    import aiohttp_jinja2
+    import jinja2
+except ImportError as err:
+    raise ImportError(
+        'Web dependencies are missing. Install them with'
+        ' pip install "being[web]"'
+    ) from err
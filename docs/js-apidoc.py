@@ -8,6 +8,12 @@ import shutil
 import subprocess
 
 
+DOCUMENTED_KINDS = frozenset({'module', 'constant', 'function', 'class'})
+"""Doclet kinds of interest. Available kinds are 'class', 'function',
+'constant', 'member', 'module' and 'package'.
+"""
+
+
 def assert_jsdoc():
     if shutil.which('jsdoc') is None:
         raise RuntimeError(
@@ -44,25 +50,18 @@ def filter_doclets(doclets):
     """Filter doclets of interest."""
     seen = set()
     for doc in doclets:
-        # Available kinds are ['class', 'function', 'constant', 'member',
-        # 'module', 'package']
-        if doc['kind'] not in [ 'module', 'constant', 'function', 'class' ]:
-            continue
-
-        if is_undocumented(doc):
+        if doc['kind'] not in DOCUMENTED_KINDS:
             continue
 
         longname = doc['longname']
-
         if longname in seen:
             continue
 
-        # Skip class methods
-        if '#' in longname:
+        # Skip class methods (#) and inner members (~)
+        if '#' in longname or '~' in longname:
             continue
 
-        # Skip whatever that is
-        if '~' in longname:
+        if is_undocumented(doc):
             continue
 
         seen.add(longname)
@@ -79,14 +78,6 @@ def module_name(longname):
     return modname
 
 
-def remove_prefix(text, prefix):
-    """Remove prefix from text."""
-    if text.startswith(prefix):
-        return text[len(prefix):]
-
-    return text
-
-
 def format_rst_section(heading: str, level: int = 1):
     """Format reStructuredText section header."""
     underline = ('=-~"' + "'^#*$`")[level - 1]
@@ -162,7 +153,7 @@ def assign_doclets_to_packages(doclets):
 
 
 def write_package(directory, package):
-    fp = os.path.join(directory, package.fullname.replace('/', '.') + '.rst')
+    fp = os.path.join(directory, package.dottedname + '.rst')
     if not package.fullname:
         print(f'Skipping empty file name {fp!r}')
         return
@@ -177,6 +168,8 @@ class Node:
         self.name = name
         self.children = {}
         self.parent = None
+        self.fullname = name
+        """Slash separated path from the root. Set when attached to parent."""
 
         if parent:
             parent.add_child(self)
@@ -191,6 +184,10 @@ class Node:
 
         self.children[child.name] = child
         child.parent = self
+        if self.fullname:
+            child.fullname = f'{self.fullname}/{child.name}'
+        else:
+            child.fullname = child.name
 
     def dfs(self):
         queue = collections.deque([self])
@@ -223,10 +220,8 @@ class Rst(Node):
         return not self.is_leave
 
     @property
-    def fullname(self):
-        names = [n.name for n in self.upstream()]
-        fullname = '/'.join(reversed(names))
-        return remove_prefix(fullname, '/')
+    def dottedname(self):
+        return self.fullname.replace('/', '.')
 
     def comment_lines(self):
         lines = []
@@ -268,10 +263,7 @@ class Rst(Node):
         lines.extend(self.comment_lines())
         if subpackages:
             lines.append(format_rst_section('Submodules', level=2))
-            entries = [
-                pkg.fullname.replace('/', '.')
-                for pkg in subpackages
-            ]
+            entries = [pkg.dottedname for pkg in subpackages]
             lines.append(format_rst_toctree(entries))
 
         if submodules:
@@ -3,12 +3,12 @@
 import logging
 
 from being.awakening import awake
-from being.backends import CanBackend
+from being.backends import default_can_backend
 from being.behavior import Behavior
 from being.logging import setup_logging, suppress_other_loggers, get_logger
 from being.motion_player import MotionPlayer
 from being.motors import LinearMotor
-from being.resources import register_resource, manage_resources
+from being.resources import manage_resources
 from being.sensors import SensorGpio
 
 
@@ -25,8 +25,7 @@ logger = get_logger(name="pathos_being")
 
 with manage_resources():
     # Scan for motors
-    network = CanBackend.single_instance_setdefault()
-    register_resource(network, duplicates=False)
+    network = default_can_backend()
 
     # Some CAN loggers are set up later on during runtime
     suppress_other_loggers('canopen', 'can')
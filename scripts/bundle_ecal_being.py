@@ -7,12 +7,16 @@ Resources:
 """
 import argparse
 import contextlib
-import glob
+import gzip
 import io
 import os
+import shutil
+import subprocess
 import sys
 import tarfile
+import tempfile
 import zipfile
+from typing import Optional
 
 
 NODE_IDS = {
@@ -56,22 +60,49 @@ echo "Uploading source code to kit {hostname}";
 echo {tarname};
 cat "{tarname}" | ssh "pi@{hostname}.local" "tar zxvf -";
 echo "Restarting being.service";
-ssh "pi@{hostname}.local" "sudo systemctl restart being.service";
+ssh "pi@{hostname}.local" "{restart}";
 echo "Done with updating the software. You can close now this windows.";
 '''
 
+RESTART_COMMAND = 'sudo systemctl restart being.service'
+"""Remote shell command for restarting being after an update."""
+
 TMP_SCRIPT = 'tmp script.sh'
 """Tmp script filename for making it executable."""
 
+TAR_BUFSIZE = 1024 * 1024
+"""Block size for streaming tar writes."""
+
+COPY_BUFSIZE = 1024 * 1024
+"""Chunk size for copying the tar archive into the zip."""
+
 
 def cli() -> argparse.Namespace:
     """Command line interface."""
     parser = argparse.ArgumentParser()
     parser.add_argument('id', help='ECAL being kit id', type=int)
     parser.add_argument('-v', '--verbose', default=False, action='store_true')
+    parser.add_argument('--pure-python', default=False, action='store_true', help='pack with tarfile module instead of external tar')
+    parser.add_argument('--direct', default=False, action='store_true', help='install directly on the kit over SSH instead of bundling a zip')
     return parser.parse_args()
 
 
+def scandir_recursive(directory: str):
+    """Recursively iterate over all directory entries.
+
+    Args:
+        directory: Directory to scan.
+
+    Yields:
+        os.DirEntry: Directory entries.
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            yield entry
+            if entry.is_dir(follow_symlinks=False):
+                yield from scandir_recursive(entry.path)
+
+
 def remove_py_cache(directory: str):
     """Remove all Python cache files and __pycache__ directories at
     directory.
@@ -80,8 +111,14 @@ def remove_py_cache(directory: str):
         directory: Directory to recursively purge from Python cache files /
             directories.
     """
-    cmd = f'find "{directory}" | grep -E "(__pycache__|\.pyc|\.pyo$)" | xargs rm -rf'
-    return os.system(cmd)
+    for root, dirs, files in os.walk(directory):
+        if '__pycache__' in dirs:
+            shutil.rmtree(os.path.join(root, '__pycache__'))
+            dirs.remove('__pycache__')
+
+        for fn in files:
+            if fn.endswith(('.pyc', '.pyo')):
+                os.remove(os.path.join(root, fn))
 
 
 def format_ecal_program(id: int) -> str:
@@ -121,6 +158,101 @@ def write_string(tarh, data, arcname):
     tarh.addfile(tarinfo, io.BytesIO(data.encode()))
 
 
+def compress_program() -> Optional[list]:
+    """Gzip compatible compression command. Prefers multi threaded pigz over
+    plain gzip. None if neither is installed.
+    """
+    for program in ['pigz', 'gzip']:
+        if shutil.which(program):
+            return [program, '-6']
+
+    return None
+
+
+def pack_with_tar(out, sourcefiles, extras, verbose=False):
+    """Create tar.gz archive with external tar and gzip / pigz programs.
+    Source files are placed under a ``being/`` prefix.
+
+    Args:
+        out: Binary output file object (file or pipe).
+        sourcefiles: Source filepaths relative to the current working
+            directory.
+        extras: Arcname -> string content mapping for additional files.
+
+    Kwargs:
+        verbose: Verbose output.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # Stage the string payloads as files and link the project root as
+        # being/ so that tar stores the source files with the correct prefix.
+        for arcname, data in extras.items():
+            with open(os.path.join(tmpdir, arcname), 'w') as f:
+                f.write(data)
+
+        os.symlink(os.getcwd(), os.path.join(tmpdir, 'being'))
+        members = [os.path.join('being', fp) for fp in sourcefiles]
+        members.extend(extras)
+        fileList = os.path.join(tmpdir, 'files.txt')
+        with open(fileList, 'w') as f:
+            f.write('\n'.join(members) + '\n')
+
+        tarCmd = ['tar', '-cf', '-', '--no-recursion', '-C', tmpdir, '-T', fileList]
+        compressCmd = compress_program()
+        if compressCmd is None:
+            raise RuntimeError('Neither pigz nor gzip is installed')
+
+        if verbose:
+            print(f'Packing with tar and {compressCmd[0]}')
+
+        out.flush()
+        # No AppleDouble ._* files / xattr headers from bsdtar on macOS
+        env = {**os.environ, 'COPYFILE_DISABLE': '1'}
+        tar = subprocess.Popen(tarCmd, stdout=subprocess.PIPE, env=env)
+        try:
+            compressor = subprocess.Popen(compressCmd, stdin=tar.stdout, stdout=out)
+        except OSError:
+            tar.kill()
+            tar.wait()
+            raise
+        finally:
+            tar.stdout.close()
+
+        compressor.wait()
+        tar.wait()
+        if tar.returncode or compressor.returncode:
+            raise RuntimeError('Could not create tar archive')
+
+
+def pack_with_tarfile(out, sourcefiles, extras, verbose=False):
+    """Create tar.gz archive with the tarfile module. Same layout as
+    :func:`pack_with_tar`.
+    """
+    # Stream mode 'w|gz' only accepts a compresslevel since Python 3.12.
+    # Wrapping the output in GzipFile gives the same stream on older versions.
+    with gzip.GzipFile(fileobj=out, mode='wb', compresslevel=6) as gz, tarfile.open(
+        fileobj=gz,
+        mode='w|',
+        bufsize=TAR_BUFSIZE,
+    ) as tarh:
+        if verbose:
+            print('Packing source files ')
+
+        for fp in sourcefiles:
+            dst = os.path.join('being', fp)
+            if verbose:
+                print(f'Adding {dst!r}')
+
+            info = tarh.gettarinfo(fp, arcname=dst)
+            with open(fp, 'rb') as f:
+                tarh.addfile(info, f)
+
+        for arcname, data in extras.items():
+            if verbose:
+                print(f'Creating {arcname!r}')
+
+            write_string(tarh, data, arcname)
+
+
 if __name__ == '__main__':
     args = cli()
     hostname = f'ecal-being-{args.id}'
@@ -135,7 +267,11 @@ if __name__ == '__main__':
     # Being source files
     sourcedir = 'being'
     remove_py_cache(sourcedir)
-    sourcefiles = glob.glob(sourcedir + '/**/*', recursive=True)
+    sourcefiles = [
+        entry.path
+        for entry in scandir_recursive(sourcedir)
+        if entry.is_file()
+    ]
     assert bool(sourcefiles), f'Did not find being source files in {sourcedir!r}!'
     print(f'Found {len(sourcefiles)} source files in {sourcedir!r}')
 
@@ -143,12 +279,41 @@ if __name__ == '__main__':
     print(f'Formatting ecal_being.py program for kit {args.id}')
     ecalProgram = format_ecal_program(args.id)
 
+    extras = {
+        'ecal_being.py': ecalProgram,
+        'being.ini': BEING_INI,
+    }
+    if args.pure_python or not shutil.which('tar') or compress_program() is None:
+        pack = pack_with_tarfile
+    else:
+        pack = pack_with_tar
+
+    if args.direct:
+        address = f'pi@{hostname}.local'
+        print(f'Streaming source code to {address!r}')
+        ssh = subprocess.Popen(
+            ['ssh', address, f'tar zxf - && {RESTART_COMMAND}'],
+            stdin=subprocess.PIPE,
+        )
+        try:
+            pack(ssh.stdin, sourcefiles, extras, args.verbose)
+        finally:
+            ssh.stdin.close()
+            ssh.wait()
+
+        if ssh.returncode:
+            sys.exit(f'Could not install on {address!r}')
+
+        print(f'Successfully installed on {address!r}')
+        sys.exit(0)
+
     with contextlib.ExitStack() as stack:
         # Bash install script
         print(f'Formatting install.sh script for {hostname!r}')
         installScript = INSTALL_SCRIPT_TEMPLATE.format(
             hostname=hostname,
             tarname=tarname,
+            restart=RESTART_COMMAND,
         )
 
         if os.path.exists(TMP_SCRIPT):
@@ -162,36 +327,24 @@ if __name__ == '__main__':
         os.chmod(TMP_SCRIPT, 0o500)
         stack.callback(lambda: os.remove(TMP_SCRIPT))
 
-        with tarfile.open(tarname, 'w:gz') as tarh:
-            if args.verbose:
-                print(f'Creating {tarname!r} (tmp file)')
-                print('Packing source files ')
-
-            for fp in sourcefiles:
-                dst = os.path.join('being', fp)
-                if args.verbose:
-                    print(f'Adding {dst!r}')
-
-                tarh.add(fp, dst)
-
-            if args.verbose:
-                print("Creating 'ecal_being.py'")
-
-            write_string(tarh, ecalProgram, 'ecal_being.py')
-
-            if args.verbose:
-                print("Creating 'being.ini'")
+        if args.verbose:
+            print(f'Creating {tarname!r} (tmp file)')
 
-            write_string(tarh, BEING_INI, 'being.ini')
+        with open(tarname, 'wb') as out:
+            pack(out, sourcefiles, extras, args.verbose)
 
         stack.callback(lambda: os.remove(tarname))
 
-        with zipfile.ZipFile(zipname, 'w') as ziph:
+        # The tar is already gzip compressed. Store it as is and copy it over
+        # in large chunks.
+        with zipfile.ZipFile(zipname, 'w', compression=zipfile.ZIP_STORED) as ziph:
             if args.verbose:
                 print(f'Creating {zipname!r}')
                 print(f'Moving {tarname!r} -> {zipname!r}')
 
-            ziph.write(tarname)
+            info = zipfile.ZipInfo.from_file(tarname)
+            with open(tarname, 'rb') as src, ziph.open(info, 'w', force_zip64=True) as dst:
+                shutil.copyfileobj(src, dst, length=COPY_BUFSIZE)
 
             if args.verbose:
                 print('Packing install.sh')
@@ -6,6 +6,7 @@ import sys
 import time
 
 import canopen
+import canopen.lss
 
 if sys.platform == 'darwin':
     from being.can.pcan_darwin_patch import patch_pcan_on_darwin
@@ -27,6 +28,30 @@ def cli():
     return parser.parse_args()
 
 
+def wait_for_lss_slave(lss, timeout=1., interval=.01):
+    """Poll LSS slave until it answers a node id inquiry instead of waiting
+    a fixed amount of time.
+
+    Args:
+        lss: LSS master.
+
+    Kwargs:
+        timeout: Maximum waiting time in seconds.
+        interval: Polling interval in seconds.
+
+    Returns:
+        Inquired node id or None if the slave did not respond in time.
+    """
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            return lss.inquire_node_id()
+        except canopen.lss.LssError:
+            time.sleep(interval)
+
+    return None
+
+
 def bus_params():
     """System dependent bus parameters."""
     if sys.platform == 'darwin':
@@ -57,11 +82,12 @@ if __name__ == '__main__':
         idx = POSSIBLE_BIT_RATES.index(args.bitrate)
         network.lss.configure_bit_timing(idx)
 
-        time.sleep(1.)
-
-        #LOGGER.info('inquiring node id')
-        #node_id = network.lss.inquire_node_id()
-        #LOGGER.info('Node id:', node_id)
+        LOGGER.info('Waiting for node')
+        nodeId = wait_for_lss_slave(network.lss)
+        if nodeId is None:
+            LOGGER.warning('Node did not respond to LSS inquiry')
+        else:
+            LOGGER.info('Active node id: %d', nodeId)
 
         LOGGER.info('Storing configuration')
         network.lss.store_configuration()
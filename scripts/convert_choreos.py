@@ -2,14 +2,16 @@
 """Convert choreo files to BPoly splines CLI util."""
 import argparse
 import configparser
+import functools
 import glob
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
 
 from scipy.interpolate import BPoly
 
 from being.choreo import convert_choreo_to_spline
-from being.serialization import dumps, BeingEncoder
+from being.serialization import BeingEncoder
 from being.utils import rootname
 
 
@@ -32,49 +34,56 @@ def collect_choreo_files(filepaths):
             yield fp
 
 
-def unique_elements(iterable):
-    seen = set()
-    for ele in iterable:
-        if ele in seen:
-            continue
+def convert_choreo_file(src, outputDir=None, verbose=False) -> str:
+    """Convert single choreo file to BPoly spline JSON file.
 
-        seen.add(ele)
-        yield ele
+    Args:
+        src: Choreo filepath.
 
+    Kwargs:
+        outputDir: Output directory. Next to the choreo file if None.
+        verbose: Verbose console output.
 
-def main():
-    args = cli()
-    choreos = list(collect_choreo_files(args.choreos))
-    choreos = list(unique_elements(choreos))
-    if args.outputDir:
-        if not os.path.isdir(args.output):
-            raise ValueError('Output directory has to be a directory!')
+    Returns:
+        Output filepath.
+    """
+    if verbose: print(f'  Opening {src!r} .ini file')
+    choreo = configparser.ConfigParser()
+    with open(src) as f:
+        choreo.read_file(f)
 
-    for src in choreos:
-        print('Converting:', src)
+    if verbose: print(f'  Converting {src!r} choreo to BPoly spline')
+    ppoly = convert_choreo_to_spline(choreo)
+    motion = BPoly.from_power_basis(ppoly)
 
-        if args.verbose: print('  Opening .ini file')
-        choreo = configparser.ConfigParser()
-        with open(src) as f:
-            choreo.read_file(f)
+    head, tail = os.path.split(src)
+    if outputDir is not None:
+        head = outputDir
 
-        if args.verbose: print('  Converting choreo to BPoly spline')
-        ppoly = convert_choreo_to_spline(choreo)
-        motion = BPoly.from_power_basis(ppoly)
+    dst = os.path.join(head, rootname(tail) + '.json')
+    if verbose: print(f'  Saving spline to {dst!r}')
+    with open(dst, 'w') as fp:
+        json.dump(motion, fp, cls=BeingEncoder)
 
-        if args.verbose: print('  Serializing spline')
-        s = dumps(motion)
+    return dst
 
-        if args.verbose: print('  Saving spline')
-        if args.outputDir is None:
-            head, tail = os.path.split(src)
-            dst = os.path.join(head, rootname(tail) + '.json')
-        else:
-            dst = os.path.join(head, rootname(tail) + '.json')
 
-        with open(dst, 'w') as fp:
-            json.dump(motion, fp, cls=BeingEncoder)
-            print(f'Saved motion to {dst!r}')
+def main():
+    args = cli()
+    # Remove duplicates while preserving order
+    choreos = list(dict.fromkeys(collect_choreo_files(args.choreos)))
+    if args.outputDir:
+        if not os.path.isdir(args.outputDir):
+            raise ValueError('Output directory has to be a directory!')
+
+    convert = functools.partial(
+        convert_choreo_file,
+        outputDir=args.outputDir,
+        verbose=args.verbose,
+    )
+    with ProcessPoolExecutor() as executor:
+        for src, dst in zip(choreos, executor.map(convert, choreos)):
+            print(f'Converted {src!r}, saved motion to {dst!r}')
 
 
 if __name__ == '__main__':
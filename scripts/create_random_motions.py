@@ -1,12 +1,13 @@
+import json
 import os
-from random import uniform, choices
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy.interpolate import BPoly
 
 from being.kinematics import kinematic_filter_vec, State
-from being.serialization import dumps
+from being.serialization import BeingEncoder
 from being.spline import smoothing_spline
 from being.plotting import plot_spline
 from being.spline import remove_duplicates
@@ -15,6 +16,11 @@ from being.spline import remove_duplicates
 TARGET = 'content'
 DT = .01
 ROD_LENGTH = 0.04
+N_MOTIONS = 10
+MIN_DURATION = 5.
+MAX_DURATION = 20.
+TIMES = np.arange(0, MAX_DURATION, DT)
+"""Time grid for the longest possible motion. Shorter motions use a view."""
 
 
 RANDOM_WORDS = [
@@ -28,11 +34,11 @@ def save_spline(spline, name):
     fp = os.path.join(TARGET, name + '.json')
     print('Saving spline to', fp)
     with open(fp, 'w') as f:
-        f.write(dumps(spline, indent=2))
+        json.dump(spline, f, cls=BeingEncoder, indent=2, sort_keys=True)
 
 
-def random_name():
-    twoWords = choices(RANDOM_WORDS, k=2)
+def random_name(rng):
+    twoWords = rng.choice(RANDOM_WORDS, size=2)
     return '_'.join(twoWords)
 
 
@@ -44,14 +50,15 @@ def normalize(arr):
     return (arr - lower) / width
 
 
-os.makedirs(TARGET, exist_ok=True)
-
-
-for _ in range(10):
-    duration = uniform(5, 20)
-    t = np.arange(0, duration, DT)
-    n = t.shape[0]
-    r = np.random.random(n)
+def create_random_motion(seed):
+    """Create and save a single random motion. Own random generator per motion
+    so that worker processes do not share the same random state.
+    """
+    rng = np.random.default_rng(seed)
+    duration = rng.uniform(MIN_DURATION, MAX_DURATION)
+    n = int(np.ceil(duration / DT))
+    t = TIMES[:n]
+    r = rng.random(n)
     data = kinematic_filter_vec(r, dt=DT, initial=State(r[0]))
     y, _, _ = data.T
 
@@ -59,5 +66,12 @@ for _ in range(10):
     ppoly = remove_duplicates(ppoly)
     bpoly = BPoly.from_power_basis(ppoly)
     bpoly.c *= (ROD_LENGTH / bpoly.c.max())
-    name = random_name()
+    name = random_name(rng)
     save_spline(bpoly, name)
+
+
+if __name__ == '__main__':
+    os.makedirs(TARGET, exist_ok=True)
+    seeds = np.random.SeedSequence().spawn(N_MOTIONS)
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(create_random_motion, seeds))
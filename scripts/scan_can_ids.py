@@ -3,12 +3,11 @@ import warnings
 warnings.filterwarnings("ignore", category=UserWarning,
                                    module="being.backends")
 
-from being.backends import CanBackend
-from being.resources import register_resource, manage_resources
+from being.backends import default_can_backend
+from being.resources import manage_resources
 
 
 with manage_resources():
-    network = CanBackend.single_instance_setdefault()
-    register_resource(network, duplicates=False)
+    network = default_can_backend()
     nodeIds = network.scan_for_node_ids()
     print(nodeIds)
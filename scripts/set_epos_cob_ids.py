@@ -2,11 +2,11 @@
 
 import argparse
 import logging
-from being.backends import CanBackend
+from being.backends import default_can_backend
 from being.logging import setup_logging, suppress_other_loggers
 from being.can.cia_402 import CiA402Node
 from being.can import load_object_dictionary
-from being.resources import register_resource, manage_resources
+from being.resources import manage_resources
 
 
 def print_cob_ids(node):
@@ -35,8 +35,7 @@ def main():
     args = cli()
 
     with manage_resources():
-        network = CanBackend.single_instance_setdefault()
-        register_resource(network)
+        network = default_can_backend()
 
         node_id = args.nodeId
         object_dictionary = load_object_dictionary(network, node_id)
@@ -1,16 +1,30 @@
+import asyncio
 import collections
+import contextlib
 import datetime
+import functools
+import io
+import json
 import os
-import re
+import shutil
 import subprocess
 import sys
-import time
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from subprocess import TimeoutExpired, CalledProcessError
 
 import being
 
+try:
+    import asyncssh
+except ImportError:
+    asyncssh = None
+
 
 KIT_NUMBERS = [0]
+MAX_WORKERS = 16
+"""Maximum number of kits to update concurrently."""
 MOTOR_IDS = collections.defaultdict(lambda: [1, 2], {
     0: [1, 2],
     1: [3, 4],
@@ -44,59 +58,32 @@ DEFAULT_BEING_INI = """[Logging]
 DIRECTORY=log
 """
 BEING_SERVICE = 'being.service'
+SSH_OPTS = [
+    '-o', 'ControlMaster=auto',
+    '-o', 'ControlPath=/tmp/being-%C',  # %C: Short connection hash. sun_path is limited to 104 bytes
+    '-o', 'ControlPersist=60s',
+]
+"""OpenSSH multiplexing options. All ssh / scp calls to the same host share
+one connection.
+"""
 
 
-def format_timestamp(seconds):
-    parts = []
-    for div in [3600, 60, 1]:
-        a, seconds = divmod(seconds, div)
-        parts.append('%02d' % a)
-
-    return ':'.join(parts)
-
-
-def iter_with_progress_bar(stuff, length=None, prefix='', width=40, stream=sys.stdout):
-    """Iterate over stuff while a printing progress bar.
-
-    Args:
-        stuff: Stuff it iterate over.
+@functools.lru_cache(maxsize=None)
+def read_ecal_program() -> tuple:
+    """Read ECAL Being program lines and locate the NODE_IDS line. Cached so
+    that the file is only read once for all kits.
 
-    Kwargs:
-        length: Length of iterable.
-        prefix:
-        width: Progress bar character width.
-        stream: Output stream.
+    Returns:
+        tuple: Program lines and index of the NODE_IDS line.
     """
-    if length is None:
-        length = len(stuff)
-
-    startTime = time.perf_counter()
-    for i, thing in enumerate(stuff):
-        progress = max(0., min(1., (i / (length - 1))))
-
-        # Render bar
-        ticks = int(progress * width)
-        bar = '[%s%s]' % (ticks * '*', (width - ticks) * ' ')
-
-        # ETA / remaining time
-        now = time.perf_counter()
-        if progress == 0:
-            eta = float('inf')
-        else:
-            passed = now - startTime
-            eta = startTime + passed / progress
-
-        remaining = eta - now
-
-        # Print
-        stream.write('\33[2K\r')
-        stream.write(' '.join([prefix, bar, '%.1f sec' % remaining]))
-        stream.flush()
+    with open('ecal_being.py') as f:
+        lines = tuple(f.read().split('\n'))
 
-        yield thing
+    for nr, line in enumerate(lines):
+        if line.startswith('NODE_IDS'):
+            return lines, nr
 
-    stream.write('\n')
-    stream.flush()
+    raise RuntimeError("Could not find NODE_IDS line in 'ecal_being.py'")
 
 
 def format_ecal_program(motorIds: list) -> str:
@@ -108,89 +95,69 @@ def format_ecal_program(motorIds: list) -> str:
     Returns:
         str: Formatted Python program string.
     """
-    with open('ecal_being.py') as f:
-        data = f.read()
-
-    lines = data.split('\n')
-    for nr, line in enumerate(lines):
-        if line.startswith('NODE_IDS'):
-            break
-    else:
-        raise RuntimeError("Could not find MOTOR_IDS line in 'ecal_being.py'")
-
+    lines, nr = read_ecal_program()
+    lines = list(lines)
     lines[nr] = f'NODE_IDS = {motorIds}'
     ecalProgram = '\n'.join(lines)
     return ecalProgram
 
 
-def is_ssh_destination(string) -> bool:
-    """Check if string is a (more or less) valid SSH address (user@host:...)."""
-    return bool(re.match(r'([^\s]+)@([^\s]+):(.*)', string))
+def run_cmd(cmd, *args, **kwargs) -> object:
+    """Run subprocess command."""
+    return subprocess.run(cmd, *args, stdout=subprocess.DEVNULL, check=True, **kwargs)
 
 
-def validate_ssh_destination(string):
-    """Validate SSH address and raise ValueError."""
-    if not is_ssh_destination(string):
-        raise ValueError(f'{string!r} is not a valid SSH destination!')
+def stage_stuff(src, dst):
+    """Copy local file / directory or write string to dst. Parent directories
+    get created.
+    """
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    if os.path.isdir(src):
+        shutil.copytree(src, dst, ignore=shutil.ignore_patterns('__pycache__', '*.pyc', '*.pyo'))
+    elif os.path.isfile(src):
+        shutil.copy(src, dst)
+    else:
+        with open(dst, 'w') as f:
+            f.write(src)
 
 
-def run_cmd(cmd, *args, **kwargs) -> object:
-    """Run subprocess command."""
-    return subprocess.run(cmd, stdout=subprocess.DEVNULL, check=True)
-
-
-def copy_file(src, dst):
-    assert os.path.isfile(src)
-    validate_ssh_destination(dst)
-    address, filepath = dst.split(':')
-    run_cmd(['ssh', address, 'mkdir', '-p', os.path.dirname(filepath)])
-    run_cmd(['scp', src, dst])
-
-
-def copy_directory(src, dst):
-    assert os.path.isdir(src)
-    validate_ssh_destination(dst)
-    address, filepath = dst.split(':')
-    run_cmd(['ssh', address, 'mkdir', '-p', os.path.dirname(filepath)])
-    run_cmd(['scp', '-r', src, dst])
-
-
-def write_file_to_remote(data, dst):
-    """Write data to remote file."""
-    validate_ssh_destination(dst)
-    address, filepath = dst.split(':')
-    directory, filename = os.path.split(filepath)
-    run_cmd(['ssh', address, f'mkdir -p {directory}'])
-    proc = subprocess.Popen(['ssh', address, f'cat > {filepath}'], stdin=subprocess.PIPE)
-    outs, errs = proc.communicate(input=data.encode())
-    if errs:
-        raise RuntimeError(errs)
-
-
-def copy_stuff(src, dst):
-    if os.path.exists(src):
-        if os.path.isdir(src):
-            copy_directory(src, dst)
-        else:
-            copy_file(src, dst)
-    else:
-        write_file_to_remote(src, dst)
+def stage_files(directory, program):
+    """Stage everything which goes into the home directory of a kit inside
+    directory.
+
+    Args:
+        directory: Local staging directory.
+        program: Formatted ECAL being program.
+    """
+    STUFF = [
+        ('being', 'being/being'),
+        ('setup.py', 'being/setup.py'),
+        (UNTITLED_MOTION, 'content/Untitled.json'),
+        (DEFAULT_BEHAVIOR, 'behavior.json'),
+        (DEFAULT_BEING_INI, 'being.ini'),
+        (program, 'ecal_being.py'),
+    ]
+    for src, relpath in STUFF:
+        stage_stuff(src, os.path.join(directory, relpath))
 
 
-def remove_remote_directory(dst):
-    validate_ssh_destination(dst)
-    address, filepath = dst.split(':')
-    run_cmd(['ssh', address, 'rm', '-r', filepath])
+def upload_directory_contents(directory, address):
+    """Upload the contents of a local directory to the remote home directory
+    in one go. Uses rsync when available, scp otherwise.
+    """
+    entries = [os.path.join(directory, name) for name in sorted(os.listdir(directory))]
+    if shutil.which('rsync'):
+        sshCmd = ' '.join(['ssh', *SSH_OPTS])
+        run_cmd(['rsync', '-az', '-e', sshCmd, *entries, address + ':~/'])
+    else:
+        run_cmd(['scp', *SSH_OPTS, '-r', *entries, address + ':~/'])
 
 
-def read_remote_file(dst):
-    address, filepath = dst.split(':')
-    proc = subprocess.Popen(
-        ['ssh', address, 'cat', filepath],
-        stdout=subprocess.PIPE,
-    )
-    data = proc.stdout.read()
-    return data.decode()
+def run_remote_batch(address, commands):
+    """Run multiple shell commands with a single SSH call. Stops at the first
+    failing command.
+    """
+    run_cmd(['ssh', *SSH_OPTS, address, ' && '.join(commands)])
 
 
 def ping(hostname, timeout=.5) -> bool:
@@ -205,86 +172,209 @@ def ping(hostname, timeout=.5) -> bool:
         return False
 
 
-def being_service(address, command):
-    run_cmd(['ssh', address, 'sudo', 'systemctl', command, BEING_SERVICE])
+VALIDATION_PROGRAM = b"""import json
+import os
+
+
+def read(filepath):
+    try:
+        with open(os.path.expanduser(filepath)) as f:
+            return f.read()
+    except OSError:
+        return ''
+
+
+try:
+    import being
+    version = being.__version__
+except (ImportError, AttributeError):
+    version = ''
+
+print(json.dumps({
+    'program': read('~/ecal_being.py'),
+    'version': version,
+    'motion': read('~/content/Untitled.json'),
+}))
+"""
+"""Remote Python program collecting everything setup_being validates."""
 
 
-def read_remote_being_version(address, timeout=2.):
+def validate_and_restart(address, timeout=10.) -> dict:
+    """Read back remote files / being version and restart the being service
+    in one SSH round trip.
+    """
     proc = subprocess.Popen(
-        ['ssh', address, 'python3', '-'],
+        [
+            'ssh', *SSH_OPTS, address,
+            f'python3 - ; sudo systemctl restart {BEING_SERVICE}',
+        ],
         stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
     )
-
-    getVersionProgramm = b"""import sys
-import being
-print(being.__version__)
-sys.exit(0)
-"""
     try:
-        outs, errs = proc.communicate(getVersionProgramm, timeout)
-        return outs.decode().strip()
+        outs, errs = proc.communicate(VALIDATION_PROGRAM, timeout)
     except TimeoutExpired:
         proc.kill()
         outs, errs = proc.communicate()
-        return ''
+
+    return parse_validation_output(outs.decode())
 
 
-def update_remote_clock(address):
+def parse_validation_output(output: str) -> dict:
+    """Parse output of VALIDATION_PROGRAM. Empty dict if invalid."""
+    try:
+        return json.loads(output)
+    except ValueError:
+        return {}
+
+
+def print_validation(remote, program, motion=True, indent='', stream=sys.stdout):
+    """Print validation results."""
+    print(indent + '- ecal_being.py:        ', program.strip() == remote.get('program', '').strip(), file=stream)
+    print(indent + '- Correct being version:', being.__version__ == remote.get('version'), file=stream)
+    if motion:
+        print(indent + '- Untitled.json:        ', remote.get('motion') == UNTITLED_MOTION, file=stream)
+
+
+def prepare_commands() -> list:
+    """Remote shell commands to run before uploading the files."""
+    return [
+        clock_command(),
+        'rm -rf ~/being',
+        'mkdir -p ~/being ~/content',
+    ]
+
+
+def clock_command() -> str:
+    """Remote shell command for setting the clock to the local time."""
     # Note: This is not persistent since the RPi has not battery. But still
     # useful to not have time mismatches and skipped updates...
     now = datetime.datetime.now()
-    run_cmd([
-        'ssh',
-        address,
-        f'sudo date --set="{now.isoformat()}"',
-    ])
+    return f'sudo date --set="{now.isoformat()}"'
 
 
-def setup_being(nr, verbose=True, motion=True, indent=''):
+@contextlib.contextmanager
+def ssh_master(address):
+    """Keep a shared background SSH connection to address open for the
+    duration of the context.
+    """
+    run_cmd(['ssh', *SSH_OPTS, '-M', '-N', '-f', address])
+    try:
+        yield
+    finally:
+        subprocess.run(
+            ['ssh', *SSH_OPTS, '-O', 'exit', address],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+
+def setup_being(nr, verbose=True, motion=True, indent='', stream=sys.stdout):
+    """Update being kit nr. Does nothing if the kit is not reachable."""
     hostname = HOSTNAME.format(nr)
-    reachable = ping(hostname)
+    print(hostname, file=stream)
+    if not ping(hostname):
+        print(indent + 'NOT REACHABLE', file=stream)
+        return
+
     address = 'pi@' + hostname
-    program = format_ecal_program(MOTOR_IDS[nr])
+    with ssh_master(address):
+        program = format_ecal_program(MOTOR_IDS[nr])
 
-    if verbose: print(indent + 'Updating clock')
-    update_remote_clock(address)
+        if verbose: print(indent + 'Updating clock and preparing directories', file=stream)
+        run_remote_batch(address, prepare_commands())
 
-    try:
-        remove_remote_directory(address + ':~/being')
-    except CalledProcessError:
-        pass
+        print(indent + 'Copying files', file=stream)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            stage_files(tmpdir, program)
+            upload_directory_contents(tmpdir, address)
 
-    STUFF = [
-        ('being', address + ':~/being/being'),
-        ('setup.py', address + ':~/being/setup.py'),
-        (UNTITLED_MOTION, address + ':~/content/Untitled.json'),
-        (DEFAULT_BEHAVIOR, address + ':~/behavior.json'),
-        (DEFAULT_BEING_INI, address + ':~/being.ini'),
-        (program, address + ':~/ecal_being.py'),
-    ]
-    for src, dst in iter_with_progress_bar(STUFF, prefix=indent + 'Copying files'):
-        copy_stuff(src, dst)
-
-    print(indent + 'Validate')
-    remoteProgram = read_remote_file(address + ':~/ecal_being.py')
-    print(indent + '- ecal_being.py:        ', program.strip() == remoteProgram.strip())
-    ver = read_remote_being_version(address)
-    print(indent + '- Correct being version:', being.__version__ == ver)
-    if motion:
-        m = read_remote_file(address + ':~/content/Untitled.json')
-        print(indent + '- Untitled.json:        ', m == UNTITLED_MOTION)
+        print(indent + 'Validate and restart ' + BEING_SERVICE, file=stream)
+        remote = validate_and_restart(address)
+        print_validation(remote, program, motion, indent, stream)
 
-    print(indent + 'Restarting ' + BEING_SERVICE)
-    being_service(address, 'restart')
+
+def setup_being_buffered(nr, lock, **kwargs):
+    """Run setup_being() with buffered output and print it in one go. Keeps
+    the output of concurrent updates from interleaving.
+    """
+    buf = io.StringIO()
+    try:
+        setup_being(nr, stream=buf, **kwargs)
+    finally:
+        with lock:
+            print(buf.getvalue(), end='', flush=True)
 
 
-for nr in KIT_NUMBERS:
+async def setup_being_async(nr, verbose=True, motion=True, indent='', stream=sys.stdout):
+    """Update being kit nr with asyncssh. All commands and the file upload go
+    through channels of a single SSH connection. Does nothing if the kit is not
+    reachable.
+    """
     hostname = HOSTNAME.format(nr)
-    print(hostname)
-    reachable = ping(hostname)
-    if not reachable:
-        print('  NOT REACHABLE')
-        continue
+    print(hostname, file=stream)
+    loop = asyncio.get_running_loop()
+    if not await loop.run_in_executor(None, ping, hostname):
+        print(indent + 'NOT REACHABLE', file=stream)
+        return
+
+    program = format_ecal_program(MOTOR_IDS[nr])
+    async with asyncssh.connect(hostname, username='pi') as conn:
+        if verbose: print(indent + 'Updating clock and preparing directories', file=stream)
+        await conn.run(' && '.join(prepare_commands()), check=True)
+
+        print(indent + 'Copying files', file=stream)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            stage_files(tmpdir, program)
+            entries = [os.path.join(tmpdir, name) for name in sorted(os.listdir(tmpdir))]
+            async with conn.start_sftp_client() as sftp:
+                # SFTP paths are relative to the remote home directory
+                await sftp.put(entries, '.', recurse=True)
+
+        print(indent + 'Validate and restart ' + BEING_SERVICE, file=stream)
+        result = await conn.run(
+            f'python3 - ; sudo systemctl restart {BEING_SERVICE}',
+            input=VALIDATION_PROGRAM.decode(),
+        )
+        remote = parse_validation_output(result.stdout)
+        print_validation(remote, program, motion, indent, stream)
+
 
-    setup_being(nr, indent='  ')
+async def update_all_async(kits, **kwargs):
+    """Update all kits concurrently on one event loop. Output is buffered per
+    kit.
+    """
+    async def update(nr):
+        buf = io.StringIO()
+        try:
+            await setup_being_async(nr, stream=buf, **kwargs)
+        except Exception as err:
+            print(f'Kit {nr} failed: {err}', file=buf)
+        finally:
+            print(buf.getvalue(), end='', flush=True)
+
+    await asyncio.gather(*(update(nr) for nr in kits))
+
+
+def update_all_threaded(kits, **kwargs):
+    """Update all kits concurrently with a thread pool. Fallback when
+    asyncssh is not installed.
+    """
+    printLock = threading.Lock()
+    with ThreadPoolExecutor(max_workers=min(len(kits), MAX_WORKERS)) as executor:
+        futures = {
+            executor.submit(setup_being_buffered, nr, printLock, **kwargs): nr
+            for nr in kits
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as err:
+                with printLock:
+                    print(f'Kit {futures[future]} failed: {err}')
+
+
+if asyncssh is None:
+    update_all_threaded(KIT_NUMBERS, indent='  ')
+else:
+    asyncio.run(update_all_async(KIT_NUMBERS, indent='  '))
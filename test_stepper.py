@@ -3,13 +3,13 @@
 import logging
 
 from being.awakening import awake
-from being.backends import CanBackend
+from being.backends import default_can_backend
 from being.behavior import Behavior
-from being.constants import FORWARD, BACKWARD, TAU
+from being.constants import FORWARD, TAU
 from being.logging import setup_logging, suppress_other_loggers
 from being.motion_player import MotionPlayer
 from being.motors import RotaryMotor
-from being.resources import register_resource, manage_resources
+from being.resources import manage_resources
 from being.can.cia_402_stepper import StepperCiA402Node
 from being.can import load_object_dictionary_from_eds
 
@@ -19,8 +19,7 @@ setup_logging(level=log_level)
 suppress_other_loggers()
 
 with manage_resources():
-    network = CanBackend.single_instance_setdefault()
-    register_resource(network, duplicates=False)
+    network = default_can_backend()
 
     nodeId = 16
     od = load_object_dictionary_from_eds(
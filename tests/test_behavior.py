@@ -15,9 +15,12 @@ EXCITED_MOTION = 'Excited Motion'
 
 
 class DummyContent:
-    def load_curve(self, name):
+    def __init__(self):
         spline = CubicSpline([0., 1.], [[0.], [0.]])
-        return Curve(splines=[spline])
+        self.curve = Curve(splines=[spline])
+
+    def load_curve(self, name):
+        return self.curve
 
 
 class CallCounter:
@@ -37,9 +40,13 @@ class TestBehavior(unittest.TestCase):
 
     """Test behavior with test setup and one single fake motion per state."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.content = DummyContent()
+
     def setUp(self):
         self.clock = Clock(interval=0.5)
-        content = DummyContent()
+        content = self.content
         self.motionPlayer = MotionPlayer(clock=self.clock, content=content)
         params = create_params(
             attentionSpan=5.,
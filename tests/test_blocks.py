@@ -0,0 +1,43 @@
+import contextlib
+import io
+import unittest
+
+from being.blocks import Printer
+
+
+def print_once(printer: Printer, value) -> str:
+    """Feed value to printer and capture one update cycle."""
+    printer.input.value = value
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        printer.update()
+
+    return out.getvalue()
+
+
+class TestPrinter(unittest.TestCase):
+    def test_output_is_the_same_as_with_print(self):
+        for prefix in ['', 'Value:']:
+            with self.subTest(prefix=prefix):
+                expected = io.StringIO()
+                with contextlib.redirect_stdout(expected):
+                    print(prefix, 42)
+
+                self.assertEqual(print_once(Printer(prefix), 42), expected.getvalue())
+
+    def test_carriage_return_output_is_the_same_as_with_print(self):
+        for prefix in ['', 'Value:']:
+            with self.subTest(prefix=prefix):
+                expected = io.StringIO()
+                with contextlib.redirect_stdout(expected):
+                    print('\r\033c', prefix, 42, end='')
+
+                printer = Printer(prefix, carriageReturn=True)
+                self.assertEqual(print_once(printer, 42), expected.getvalue())
+
+    def test_percent_sign_in_prefix(self):
+        self.assertEqual(print_once(Printer('load %'), 0.5), 'load % 0.5\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
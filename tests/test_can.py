@@ -1,9 +1,10 @@
-import unittest
+import itertools
 import logging
+import unittest
 
 from being.can.cia_402 import (
     Command, State, find_shortest_state_path, CiA402Node, STATUSWORD_2_STATE,
-    STATUSWORD, CONTROLWORD, TRANSITION_COMMANDS
+    STATUSWORD, CONTROLWORD, TRANSITION_COMMANDS, which_state,
 )
 
 
@@ -11,16 +12,24 @@ STATE_2_STATUSWORD = {
     state: mask & value
     for mask, value, state in STATUSWORD_2_STATE
 }
+"""State -> statusword value."""
 
 
-def which_statusword(state: State) -> int:
-    """Produce statusword value for a given state."""
-    return STATE_2_STATUSWORD[state]
+COMMAND_2_STATE = {}
+"""(current state, controlword command) -> next state. First match wins (like a
+linear scan over TRANSITION_COMMANDS).
+"""
+
+for (_src, _dst), _command in TRANSITION_COMMANDS.items():
+    COMMAND_2_STATE.setdefault((_src, _command), _dst)
 
 
 class DummyVariable:
 
     """Placeholder proxy for canopen Variable."""
+
+    __slots__ = ('node',)
+
     def __init__(self, node):
         self.node = node
 
@@ -45,35 +54,36 @@ class DummyNode(CiA402Node):
         self._stateSwitching = None
         self.logger = logging.getLogger('dummy')
 
+        # Communication channels all lead back to the node itself
+        self.sdo = self.pdo = self.tpdo = self.rpdo = self
+
     def read_callback(self, who):
         if who is self._statusword:
             self.tick()
-            return which_statusword(self.state)
+            return STATE_2_STATUSWORD[self.state]
 
     def write_callback(self, who, value):
         if who is self._controlword:
-            for (src, dst), command in TRANSITION_COMMANDS.items():
-                if src == self.state and command == value:
-                    break
-            else:
+            src = self.state
+            dst = COMMAND_2_STATE.get((src, value))
+            if dst is None:
                 raise RuntimeError
 
             if src is dst:
                 return
 
             n = max(0, self.cyclesNeeded - 1)
-            self._stateSwitching = iter( n * [self.state] + [dst])
+            self._stateSwitching = itertools.chain(itertools.repeat(self.state, n), [dst])
 
     def tick(self):
-        if self._stateSwitching:
-            try:
-                self.state = next(self._stateSwitching)
-            except StopIteration:
-                self._stateSwitching = None
+        if self._stateSwitching is None:
+            return
 
-    def __getattr__(self, name):
-        if name in ('sdo', 'pdo', 'tpdo', 'rpdo'):
-            return self
+        state = next(self._stateSwitching, None)  # States are never None
+        if state is None:
+            self._stateSwitching = None
+        else:
+            self.state = state
 
     def __getitem__(self, item):
         if item == STATUSWORD:
@@ -94,6 +104,22 @@ class TestCommand(unittest.TestCase):
         self.assertEqual(Command.FAULT_RESET, (1 << 7))
 
 
+class TestWhichState(unittest.TestCase):
+    def test_lookup_table_matches_statusword_masks(self):
+        for statusword in range(1 << 16):
+            expected = None
+            for mask, value, state in STATUSWORD_2_STATE:
+                if (statusword & mask) == value:
+                    expected = state
+                    break
+
+            if expected is None:
+                with self.assertRaises(ValueError):
+                    which_state(statusword)
+            else:
+                self.assertIs(which_state(statusword), expected)
+
+
 class TestStateSwitching(unittest.TestCase):
     def test_shortest_path_from_state_to_itself_is_empty(self):
         for state in State:
@@ -1,4 +1,6 @@
 import io
+import os
+import tempfile
 import unittest
 
 from being.configs import (
@@ -9,6 +11,7 @@ from being.configs import (
     _TomlConfig,
     _YamlConfig,
     Config,
+    read_config,
 )
 
 
@@ -117,6 +120,13 @@ Behavior:  # Behavior related configurations
   - Fireworks
 """
 
+YAML_1_2_SAMPLE = """General:
+  INTERVAL: 1e-2
+  Mode: on
+  Count: 010
+"""
+"""Values which YAML 1.1 parsers interpret differently (float, bool, octal)."""
+
 TOML_SAMPLE = """[General]
 INTERVAL = 0.01 # Single cycle interval duration
 
@@ -128,15 +138,24 @@ INTERVAL = 0.01 # Single cycle interval duration
 
 
 class TestConfig(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.implTypes = tuple(IMPLEMENTATIONS.values())
+
+        # Parsed once. Only for tests which do not mutate it!
+        cls.someToml = _TomlConfig()
+        cls.someToml.loads(SOME_TOML)
+
     def test_none_config_format_is_ConfigImpl(self):
         config = Config(configFormat=None)
 
         self.assertIs(type(config.impl), _ConfigImpl)
 
     def test_initial_data_is_dict_like_and_empty(self):
-        for implType in IMPLEMENTATIONS.values():
-            impl = implType()
-            self.assertEqual(impl, {})
+        for implType in self.implTypes:
+            with self.subTest(implType=implType.__name__):
+                impl = implType()
+                self.assertEqual(impl, {})
 
     def test_config_impl_leaves_original_data_untouched(self):
         data = {}
@@ -154,6 +173,18 @@ class TestConfig(unittest.TestCase):
         self.assertIn('is', config['This'])
         self.assertIn('it', config['This']['is'])
 
+    def test_deep_names_with_shared_prefix_share_intermediate_entries(self):
+        config = Config()
+        prefix = '/'.join(f'level{i}' for i in range(63))
+        names = [f'{prefix}/key{i}' for i in range(1000)]
+        for i, name in enumerate(names):
+            config.store(name, i)
+
+        self.assertEqual(list(config), ['level0'])
+        self.assertEqual(len(config.retrieve(prefix)), len(names))
+        for i, name in enumerate(names):
+            self.assertEqual(config.retrieve(name), i)
+
     def test_stored_value_can_be_retrieved(self):
         config = Config()
         name = 'This/is/it'
@@ -206,10 +237,25 @@ class TestConfig(unittest.TestCase):
         self.assert_round_trip_string(_IniConfig(), INI_SAMPLE)
         self.assert_round_trip_stream(_IniConfig(), INI_SAMPLE)
 
+    def test_ini_can_be_dumped_to_text_stream(self):
+        impl = _IniConfig()
+        impl.loads(INI_SAMPLE)
+        out = io.StringIO()
+        impl.dump(out)
+
+        self.assertEqual(out.getvalue(), INI_SAMPLE)
+
     def test_json_preserves_round_trip(self):
         self.assert_round_trip_string(_JsonConfig(), JSON_SAMPLE)
         self.assert_round_trip_stream(_JsonConfig(), JSON_SAMPLE)
 
+    def test_json_accepts_non_finite_numbers(self):
+        impl = _JsonConfig()
+        impl.loads('{"a": NaN, "b": Infinity}')
+
+        self.assertNotEqual(impl['a'], impl['a'])
+        self.assertEqual(impl['b'], float('inf'))
+
     def test_yaml_preserves_round_trip(self):
         self.assert_round_trip_string(_YamlConfig(), YAML_SAMPLE)
         self.assert_round_trip_stream(_YamlConfig(), YAML_SAMPLE)
@@ -220,8 +266,7 @@ class TestConfig(unittest.TestCase):
 
     def test_loading_and_dumping_leaves_data_untouched(self):
         # TOML
-        a = _TomlConfig()
-        a.loads(SOME_TOML)
+        a = self.someToml
 
         b = _TomlConfig()
         b.loads(a.dumps())
@@ -238,10 +283,7 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(a, b)
 
     def test_toml_preserves_comments(self):
-        config = _TomlConfig()
-        config.loads(SOME_TOML)
-
-        self.assertEqual(config.dumps(), SOME_TOML)
+        self.assertEqual(self.someToml.dumps(), SOME_TOML)
 
     def test_yaml_preserves_comments(self):
         config = _YamlConfig()
@@ -255,16 +297,58 @@ class TestConfig(unittest.TestCase):
     #    pass
 
     def test_clearing_config_does_not_alter_underlying_data_type(self):
-        for implType in IMPLEMENTATIONS.values():
-            impl = implType()
-            typeAsItWas = type(impl.data)
-            impl.clear()
+        for implType in self.implTypes:
+            with self.subTest(implType=implType.__name__):
+                impl = implType()
+                typeAsItWas = type(impl.data)
+                impl.clear()
 
-            self.assertEqual(impl, {})
-            self.assertIs(type(impl.data), typeAsItWas)
+                self.assertEqual(impl, {})
+                self.assertIs(type(impl.data), typeAsItWas)
 
     # TODO: _IniConfig commenting test cases
 
 
+class TestReadConfig(unittest.TestCase):
+    def assert_read_config_equals_round_trip_config(self, ext, string):
+        with tempfile.TemporaryDirectory() as dirpath:
+            filepath = os.path.join(dirpath, 'config.' + ext)
+            with open(filepath, 'w') as fp:
+                fp.write(string)
+
+            data = read_config(filepath)
+
+        impl = IMPLEMENTATIONS[ext]()
+        impl.loads(string)
+
+        self.assertEqual(data, impl.data)
+
+    def test_yaml_data_is_the_same_as_with_round_trip_loader(self):
+        self.assert_read_config_equals_round_trip_config('yaml', YAML_SAMPLE)
+
+    def test_yaml_data_follows_yaml_1_2_like_round_trip_loader(self):
+        self.assert_read_config_equals_round_trip_config('yaml', YAML_1_2_SAMPLE)
+
+        with tempfile.TemporaryDirectory() as dirpath:
+            filepath = os.path.join(dirpath, 'config.yaml')
+            with open(filepath, 'w') as fp:
+                fp.write(YAML_1_2_SAMPLE)
+
+            data = read_config(filepath)
+
+        self.assertEqual(data, {'General': {'INTERVAL': 0.01, 'Mode': 'on', 'Count': 10}})
+
+    def test_toml_data_is_the_same_as_with_round_trip_loader(self):
+        self.assert_read_config_equals_round_trip_config('toml', TOML_SAMPLE)
+        self.assert_read_config_equals_round_trip_config('toml', SOME_TOML)
+
+    def test_other_formats_fall_back_to_config_file(self):
+        self.assert_read_config_equals_round_trip_config('json', JSON_SAMPLE)
+        self.assert_read_config_equals_round_trip_config('ini', INI_SAMPLE)
+
+    def test_empty_yaml_file_gives_empty_dict(self):
+        self.assert_read_config_equals_round_trip_config('yaml', '')
+
+
 if __name__ == '__main__':
     unittest.main()
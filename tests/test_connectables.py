@@ -78,6 +78,23 @@ class TestConnectables(TestConnections):
         for dst in destinatons:
             self.assert_connected(src, dst)
 
+    def test_connectables_have_no_instance_dict(self):
+        for cls in [ValueInput, ValueOutput, MessageOutput]:
+            con = cls()
+            self.assertFalse(hasattr(con, '__dict__'))
+            with self.assertRaises(AttributeError):
+                con.someAttribute = 42
+
+    def test_message_input_push_can_be_patched(self):
+        received = []
+        input_ = MessageInput()
+        input_.push = received.append
+        output = MessageOutput()
+        output.connect(input_)
+        output.send('hello')
+
+        self.assertEqual(received, ['hello'])
+
     def test_input_already_connected(self):
         input_ = InputBase()
         input_.connect(OutputBase())
@@ -167,6 +184,15 @@ class TestMessageConnections(unittest.TestCase):
         self.assertEqual(list(input_.receive()), messages)
         self.assertEqual(len(input_.queue), 0)
 
+    def test_messages_arriving_while_receiving_are_kept_for_next_time(self):
+        input_ = MessageInput()
+        input_.push('first')
+        for msg in input_.receive():
+            input_.push('second')
+
+        self.assertEqual(list(input_.receive()), ['second'])
+        self.assertEqual(list(input_.receive()), [])
+
     def test_receive_latest(self):
         input_ = MessageInput()
 
@@ -217,6 +217,13 @@ class TopologicalSorting(unittest.TestCase):
 
         self.assertEqual(order, [0, 1, 2, 3, 4, 5])
 
+    def test_sorting_leaves_relationship_dicts_untouched(self):
+        graph = Graph(edges=[(0, 1), (1, 2)])
+        topological_sort(graph)
+
+        self.assertEqual(graph.successors, {0: [1], 1: [2]})
+        self.assertEqual(graph.predecessors, {1: [0], 2: [1]})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -12,7 +12,8 @@ class DummyConfigFile(Config):
         self.stream = io.StringIO()
 
     def save(self):
-        self.stream = io.StringIO()
+        self.stream.seek(0)
+        self.stream.truncate()
         self.impl.dump(self.stream)
 
     def reload(self):
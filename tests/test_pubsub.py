@@ -16,6 +16,8 @@ class CallCounter:
 
     """Keeping track of calls and latest args / kwargs."""
 
+    __slots__ = ('nCalls', 'args', 'kwargs')
+
     def __init__(self):
         self.nCalls = 0
 
@@ -26,8 +28,11 @@ class CallCounter:
 
 
 class TestPubSub(unittest.TestCase):
+    def setUp(self):
+        self.pubsub = PubSub(Event)
+
     def test_subscribers_receive_notifications(self):
-        pubsub = PubSub(Event)
+        pubsub = self.pubsub
         subscriber = CallCounter()
         pubsub.subscribe(Event.EVENT, subscriber)
 
@@ -38,7 +43,7 @@ class TestPubSub(unittest.TestCase):
         self.assertEqual(subscriber.nCalls, 1)
 
     def test_subscribers_receive_provided_arguments(self):
-        pubsub = PubSub(Event)
+        pubsub = self.pubsub
         subscriber = CallCounter()
         pubsub.subscribe(Event.EVENT, subscriber)
         pubsub.publish(Event.EVENT, 'Hello', thing='world')
@@ -47,7 +52,7 @@ class TestPubSub(unittest.TestCase):
         self.assertEqual(subscriber.kwargs, {'thing': 'world'})
 
     def test_no_more_notifications_when_unsubscribed(self):
-        pubsub = PubSub(Event)
+        pubsub = self.pubsub
         subscriber = CallCounter()
         pubsub.subscribe(Event.EVENT, subscriber)
         pubsub.unsubscribe(Event.EVENT, subscriber)
@@ -56,7 +61,7 @@ class TestPubSub(unittest.TestCase):
         self.assertEqual(subscriber.nCalls, 0)
 
     def test_multiple_subscribtions_lead_to_single_notificaiton(self):
-        pubsub = PubSub(Event)
+        pubsub = self.pubsub
         subscriber = CallCounter()
         pubsub.subscribe(Event.EVENT, subscriber)
         pubsub.subscribe(Event.EVENT, subscriber)
@@ -65,7 +70,7 @@ class TestPubSub(unittest.TestCase):
         self.assertEqual(subscriber.nCalls, 1)
 
     def test_multiple_subscribers_get_called_idividually(self):
-        pubsub = PubSub(Event)
+        pubsub = self.pubsub
         first = CallCounter()
         second = CallCounter()
         pubsub.subscribe(Event.EVENT, first)
@@ -76,7 +81,7 @@ class TestPubSub(unittest.TestCase):
         self.assertEqual(second.nCalls, 1)
 
     def test_two_event_types_one_by_one(self):
-        pubsub = PubSub(Event)
+        pubsub = self.pubsub
         first = CallCounter()
         second = CallCounter()
         pubsub.subscribe(Event.EVENT, first)
@@ -95,6 +100,15 @@ class TestPubSub(unittest.TestCase):
         self.assertEqual(first.nCalls, 1)
         self.assertEqual(second.nCalls, 1)
 
+    def test_many_subscribers_get_notified_exactly_once(self):
+        subscribers = [CallCounter() for _ in range(10_000)]
+        for sub in subscribers:
+            self.pubsub.subscribe(Event.EVENT, sub)
+
+        self.pubsub.publish(Event.EVENT)
+
+        self.assertTrue(all(sub.nCalls == 1 for sub in subscribers))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,11 +1,13 @@
 import unittest
 import enum
+import tracemalloc
 from typing import NamedTuple
 
 import numpy as np
 from numpy.testing import assert_equal
 from scipy.interpolate import PPoly, CubicSpline, BPoly
 
+import being.serialization
 from being.serialization import (
     ENUM_LOOKUP, EOT, NAMED_TUPLE_LOOKUP, FlyByDecoder, dumps, enum_from_dict,
     enum_to_dict, loads, named_tuple_as_dict, named_tuple_from_dict,
@@ -13,38 +15,50 @@ from being.serialization import (
 )
 
 
+RNG = np.random.default_rng(0)
+"""Seeded random generator for reproducible test data."""
+
+ARRAYS = (
+    np.array(1),
+    np.array(1.234),
+    RNG.random(10),
+    RNG.random((10, 2, 3)),
+    (255 * RNG.random((10, 2, 3))).astype(np.uint8),
+)
+"""Sample arrays of different shapes and dtypes."""
+
+
 class TestSerialization(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.multiDimSpline = CubicSpline([0, 1, 2, 4,], [[0, 1], [1, 0], [2, 1], [3, 0],])
+        cls.spline = CubicSpline([0, 1, 3, 6], [0, 1, 0, -1])
+        cls.ppoly = PPoly(cls.spline.c, cls.spline.x)
+        cls.bpoly = BPoly.from_power_basis(cls.spline)
+
     def assert_splines_equal(self, a, b):
-        assert_equal(a.x, a.x)
-        assert_equal(a.c, a.c)
+        assert_equal(a.x, b.x)
+        assert_equal(a.c, b.c)
         self.assertEqual(a.extrapolate, b.extrapolate)
         self.assertEqual(a.axis, b.axis)
 
     def test_splines(self):
-        spline = CubicSpline([0, 1, 2, 4,], [[0, 1], [1, 0], [2, 1], [3, 0],])
+        spline = self.multiDimSpline
         splineCpy = loads(dumps(spline))
 
         self.assert_splines_equal(spline, splineCpy)
 
     def test_that_we_end_up_with_the_correct_spline_types(self):
-        spline = CubicSpline([0, 1, 3, 6], [0, 1, 0, -1])
-        ppoly = PPoly(spline.c, spline.x)
-        bpoly = BPoly.from_power_basis(spline)
+        spline = self.spline
+        ppoly = self.ppoly
+        bpoly = self.bpoly
 
         self.assert_splines_equal(loads(dumps(spline)), ppoly)
         self.assert_splines_equal(loads(dumps(ppoly)), ppoly)
         self.assert_splines_equal(loads(dumps(bpoly)), bpoly)
 
     def test_numpy_array(self):
-        arrays = [
-            np.array(1),
-            np.array(1.234),
-            np.random.random(10),
-            np.random.random((10, 2, 3)),
-            (255 * np.random.random((10, 2, 3))).astype(np.uint8),
-        ]
-
-        for arr in arrays:
+        for arr in ARRAYS:
             arrCpy = loads(dumps(arr))
             assert_equal(arrCpy, arr)
 
@@ -101,6 +115,31 @@ class TestSerialization(unittest.TestCase):
 
         self.assertEqual(x, y)
 
+    def test_set_round_trip_does_not_accumulate_memory(self):
+        x = {1, 2, 'Hello, world!'}
+        filters = [tracemalloc.Filter(True, being.serialization.__file__)]
+        wasTracing = tracemalloc.is_tracing()
+        if not wasTracing:
+            tracemalloc.start()
+
+        try:
+            for _ in range(200):  # Warm up (also fills interpreter free lists)
+                loads(dumps(x))
+
+            before = tracemalloc.take_snapshot().filter_traces(filters)
+            for _ in range(1000):
+                loads(dumps(x))
+
+            after = tracemalloc.take_snapshot().filter_traces(filters)
+        finally:
+            if not wasTracing:
+                tracemalloc.stop()
+
+        growth = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+
+        # Leaking a single small object per round trip would be > 50 kB
+        self.assertLess(growth, 4096)
+
 
 class TestFlyByDecoder(unittest.TestCase):
     def test_doc_example(self):
@@ -115,6 +154,27 @@ class TestFlyByDecoder(unittest.TestCase):
         self.assertEqual(list(dec.decode_more(snippets[1])), [1.234, [1, 2, 3, 4]])
         self.assertEqual(list(dec.decode_more(snippets[2])), [{'a': 1, 'b': 2}])
 
+    def test_character_by_character(self):
+        dec = FlyByDecoder()
+        stream = '"Hello, World!"\x041.234\x04[1, 2, 3, 4]\x04{"a": 1, "b": 2}\x04'
+        objs = []
+        for char in stream:
+            objs.extend(dec.decode_more(char))
+
+        self.assertEqual(objs, ['Hello, World!', 1.234, [1, 2, 3, 4], {'a': 1, 'b': 2}])
+        self.assertEqual(dec.incomplete, '')
+
+    def test_streaming_many_messages(self):
+        dec = FlyByDecoder()
+        nMessages = 10_000
+        objs = []
+        extend = objs.extend
+        for _ in range(nMessages):
+            extend(dec.decode_more('42\x04'))
+
+        self.assertEqual(objs, nMessages * [42])
+        self.assertEqual(dec.incomplete, '')
+
 
 if __name__ == '__main__':
     unittest.main()
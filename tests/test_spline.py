@@ -16,6 +16,17 @@ from being.spline import (
 )
 
 
+ACCELERATIONS = np.array([1.0, 0.0, -1.0])
+"""Acceleration segments of the sample spline."""
+
+KNOTS = np.array([0.0, 1.0, 3.0, 4.0])
+"""Knots of the sample spline."""
+
+# Built splines reference these arrays. Guard them against in-place mutation
+ACCELERATIONS.flags.writeable = False
+KNOTS.flags.writeable = False
+
+
 class TestBuildSpline(unittest.TestCase):
     def test_simple_acceleration_segment(self):
         spline = build_ppoly([0.5, 0.0, -0.5], [0.0, 1.0, 2.0, 3.0])
@@ -55,7 +66,7 @@ class TestSmoothingSpline(unittest.TestCase):
 
 class TestHelpers(unittest.TestCase):
     def test_spline_coefficients(self):
-        spline = build_ppoly([1, 0, -1], [0, 1, 3, 4])
+        spline = build_ppoly(ACCELERATIONS, KNOTS)
 
         with self.assertRaises(ValueError):
             spline_coefficients(spline, -1)
@@ -68,7 +79,7 @@ class TestHelpers(unittest.TestCase):
             spline_coefficients(spline, 3)
 
     def test_ppoly_coefficients_at(self):
-        spline = build_ppoly([1, 0, -1], [0.0, 1.0, 3.0, 4.0])
+        spline = build_ppoly(ACCELERATIONS, KNOTS)
 
         assert_equal(ppoly_coefficients_at(spline, 0.0), spline_coefficients(spline, 0))
         assert_equal(ppoly_coefficients_at(spline, 1.0), spline_coefficients(spline, 1))
@@ -84,7 +95,7 @@ class TestPPolyKnotInsertion(unittest.TestCase):
         self.assertEqual(a.axis, b.axis)
 
     def test_duplicate_knots_get_not_inserted(self):
-        a = build_ppoly([1, 0, -1], [0, 1, 3, 4])
+        a = build_ppoly(ACCELERATIONS, KNOTS)
         b = ppoly_insert(0.0, a)
 
         self.assert_splines_equal(a, b)
@@ -96,15 +107,17 @@ class TestPPolyKnotInsertion(unittest.TestCase):
             ppoly_insert(not_a_ppoly, 1234)
 
     def test_prepending_knot(self):
-        orig = build_ppoly([1, 0, -1], [0, 1, 3, 4], extrapolate=False)
+        orig = build_ppoly(ACCELERATIONS, KNOTS, extrapolate=False)
         spline = ppoly_insert(-1.0, orig)
 
         assert_equal(spline.x, np.r_[-1.0, orig.x])
         assert_equal(spline.c[:, 1:], orig.c)
 
     def test_insertin_knot(self):
+        # ppoly_insert() does not mutate its input. Same orig for all cases
+        orig = build_ppoly(ACCELERATIONS, KNOTS, extrapolate=False)
+
         # Inserting in segment 0
-        orig = build_ppoly([1, 0, -1], [0, 1, 3, 4], extrapolate=False)
         spline = ppoly_insert(0.5, orig)
 
         assert_equal(spline.x, [0, 0.5, 1, 3, 4])
@@ -112,7 +125,6 @@ class TestPPolyKnotInsertion(unittest.TestCase):
         assert_equal(spline.c[:, 2:], orig.c[:, 1:])
 
         # Inserting in segment 1
-        orig = build_ppoly([1, 0, -1], [0, 1, 3, 4], extrapolate=False)
         spline = ppoly_insert(1.5, orig)
 
         assert_equal(spline.x, [0, 1, 1.5, 3, 4])
@@ -120,7 +132,6 @@ class TestPPolyKnotInsertion(unittest.TestCase):
         assert_equal(spline.c[:, 3:], orig.c[:, 2:])
 
         # Inserting in segment 2
-        orig = build_ppoly([1, 0, -1], [0, 1, 3, 4], extrapolate=False)
         spline = ppoly_insert(3.5, orig)
 
         assert_equal(spline.x, [0, 1, 3, 3.5, 4])
@@ -128,7 +139,7 @@ class TestPPolyKnotInsertion(unittest.TestCase):
         assert_equal(spline.c[:, 4:], orig.c[:, 3:])
 
     def test_appending_knot(self):
-        orig = build_ppoly([1, 0, -1], [0, 1, 3, 4], extrapolate=False)
+        orig = build_ppoly(ACCELERATIONS, KNOTS, extrapolate=False)
         spline = ppoly_insert(6.0, orig)
 
         assert_equal(spline.x, np.r_[orig.x, 6.0])
@@ -159,29 +170,36 @@ def wiggle_bpoly(extrapolate: bool = True) -> BPoly:
 
 
 class TestSplineSampling(unittest.TestCase):
-    def test_works_with_both_spline_types(self):
+    @classmethod
+    def setUpClass(cls):
+        # Shared across tests. Do not mutate!
         bpoly = wiggle_bpoly(False)
-        ppoly = PPoly.from_bernstein_basis(bpoly)
+        cls.splines = {
+            'BPoly': bpoly,
+            'PPoly': PPoly.from_bernstein_basis(bpoly),
+        }
+        cls.extrapolatingSpline = wiggle_bpoly(True)
 
-        self.assertEqual(sample_spline(bpoly, 2), -1)
-        self.assertEqual(sample_spline(ppoly, 2), -1)
+    def test_works_with_both_spline_types(self):
+        for kind, spline in self.splines.items():
+            with self.subTest(kind=kind):
+                self.assertEqual(sample_spline(spline, 2), -1)
 
     def test_looping_spline(self):
         period = 5.
-        spline = wiggle_bpoly(False)
-        self.assertEqual(sample_spline(spline, 2. - 1 * period, loop=True), -1)
-        self.assertEqual(sample_spline(spline, 2. + 0 * period, loop=True), -1)
-        self.assertEqual(sample_spline(spline, 2. + 1 * period, loop=True), -1)
+        for kind, spline in self.splines.items():
+            with self.subTest(kind=kind):
+                ts = 2. + period * np.array([-1., 0., 1.])
+                assert_equal(sample_spline(spline, ts, loop=True), [-1., -1., -1.])
 
     def test_looping_spline_always_starts_from_zero(self):
-        period = 5.
-        spline = wiggle_bpoly(False)
-        self.assertEqual(sample_spline(spline, 0., loop=True), -1)
-        self.assertEqual(sample_spline(spline, 1., loop=True), -1)
-        self.assertEqual(sample_spline(spline, 2., loop=True), -1)
+        for kind, spline in self.splines.items():
+            with self.subTest(kind=kind):
+                ts = np.array([0., 1., 2.])
+                assert_equal(sample_spline(spline, ts, loop=True), [-1., -1., -1.])
 
     def test_non_extrapolate_splines_get_clipped(self):
-        spline = wiggle_bpoly(False)
+        spline = self.splines['BPoly']
 
         #self.assertEqual(sample_spline(spline, 0.), -1)
         #self.assertEqual(sample_spline(spline, 10.), 1)
@@ -201,7 +219,7 @@ class TestSplineSampling(unittest.TestCase):
         assert_almost_equal(sample_spline(spline, 10.), 1)
 
     def test_extrapolate_splines_get_extrapolated(self):
-        spline = wiggle_bpoly(True)
+        spline = self.extrapolatingSpline
 
         self.assertNotEqual(sample_spline(spline, 1.), np.nan)
 
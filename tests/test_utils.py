@@ -1,4 +1,7 @@
+import threading
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from being.utils import SingleInstanceCache, IdAware, NestedDict
 
@@ -10,6 +13,16 @@ class Foo(SingleInstanceCache):
     pass
 
 
+class SlowFoo(SingleInstanceCache):
+
+    """Test class with slow construction. Widens the window in which other
+    threads can find the cache still empty.
+    """
+
+    def __init__(self):
+        time.sleep(0.05)
+
+
 class TestSingleInstanceCache(unittest.TestCase):
     def setUp(self):
         Foo.single_instance_clear()
@@ -30,18 +43,43 @@ class TestSingleInstanceCache(unittest.TestCase):
 
         self.assertIs(a, b)
 
+    def test_same_reference_from_multiple_threads(self):
+        nThreads = 8
+        barrier = threading.Barrier(nThreads)
 
-class TestIdAware(unittest.TestCase):
-    def test_instances_of_two_different_classes_have_ascending_ids(self):
-        class Foo(IdAware):
-            pass
+        def get_instance(_):
+            barrier.wait()  # All threads ask at the same time
+            return SlowFoo.single_instance_setdefault()
+
+        with ThreadPoolExecutor(max_workers=nThreads) as executor:
+            instances = list(executor.map(get_instance, range(nThreads)))
+
+        self.assertTrue(all(foo is instances[0] for foo in instances))
+
+
+class IdFoo(IdAware):
 
-        class Bar(IdAware):
-            pass
+    """Test class."""
+
+    pass
+
+
+class IdBar(IdAware):
+
+    """Another test class."""
 
-        a = Foo()
-        b = Bar()
-        c = Foo()
+    pass
+
+
+class TestIdAware(unittest.TestCase):
+    def setUp(self):
+        for cls in [IdFoo, IdBar]:
+            IdAware.ID_COUNTERS.pop(cls, None)
+
+    def test_instances_of_two_different_classes_have_ascending_ids(self):
+        a = IdFoo()
+        b = IdBar()
+        c = IdFoo()
 
         self.assertEqual(a.id, 0)
         self.assertEqual(b.id, 0)
@@ -66,6 +104,23 @@ class TestNestedDict(unittest.TestCase):
         self.assertEqual(d['this', 'is', 'it'], {})
         self.assertEqual(d.data, {'this': {'is': {'it': {}}}})
 
+    def test_existing_intermediate_dicts_do_not_get_recreated(self):
+        created = []
+
+        def factory():
+            dct = {}
+            created.append(dct)
+            return dct
+
+        d = NestedDict(default_factory=factory)
+        d['this', 'is', 'it'] = 'Hello, world!'
+        nCreated = len(created)
+        d['this', 'is', 'it'] = 'Goodbye'
+        d.setdefault(('this', 'is', 'it'), 42)
+
+        self.assertEqual(d['this', 'is', 'it'], 'Goodbye')
+        self.assertEqual(len(created), nCreated)
+
     def test_setdefault_creates_intermediate_dicts(self):
         d = NestedDict()
         keys = ('this', 'is', 'it')
@@ -104,28 +159,6 @@ class TestNestedDict(unittest.TestCase):
         self.assertEqual(nested.get(keys, default), default)
         self.assertEqual(nested.data, dataCopy)
 
-    """
-    def test_setting_item_can_lead_to_keyerrors(self):
-        d = NestedDict()
-
-        with self.assertRaises(KeyError):
-            d['this', 'is', 'it'] = 'Hello, world!'
-
-        d['this'] = {}
-        d['this', 'is'] = {}
-        d['this', 'is', 'it'] = 'Hello, world!'
-
-        self.assertEqual(d, {'this': {'is': {'it': 'Hello, world!'}}})
-    """
-
-    """
-    def test_missing_item_results_in_keyerror(self):
-        d = NestedDict()
-
-        with self.assertRaises(KeyError):
-            d['this', 'is', 'it']
-    """
-
 
 if __name__ == '__main__':
     unittest.main()